@@ -0,0 +1,104 @@
+import numpy as np
+import pygame
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Clip id reserved for "no animation" (zero frames)
+EMPTY_CLIP: int = 0
+
+
+class AnimationClip:
+    """Immutable sequence of shared frames with a duration in ticks for each frame"""
+
+    __slots__ = ("frames", "durations", "loop")
+
+    def __init__(self, frames: Sequence[pygame.Surface], durations: Sequence[int], loop: bool = True) -> None:
+        if len(frames) != len(durations):
+            raise ValueError("Each frame needs exactly one duration")
+        self.frames: Tuple[pygame.Surface, ...] = tuple(frames)
+        self.durations: Tuple[int, ...] = tuple(max(1, int(d)) for d in durations)
+        self.loop: bool = loop
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+
+class ClipLibrary:
+    """Registry of animation clips, referenced everywhere by integer id.
+
+    Clips are deduplicated by (frames, durations, loop), so every enemy built
+    from the same shared Surfaces plays the same clip and animating only
+    moves an index; frames are never copied. ``durations_table`` and
+    ``lengths`` expose every clip as arrays for vectorized playback.
+    """
+
+    def __init__(self) -> None:
+        self._clips: List[AnimationClip] = [AnimationClip((), ())]
+        self._ids: Dict[Tuple[Tuple[pygame.Surface, ...], Tuple[int, ...], bool], int] = {}
+        self._names: Dict[str, int] = {}
+        self._retimed: Dict[Tuple[int, int], int] = {}
+        self._tables: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def __getitem__(self, clip_id: int) -> AnimationClip:
+        return self._clips[clip_id]
+
+    def __len__(self) -> int:
+        return len(self._clips)
+
+    def clip_for(self, frames: Sequence[pygame.Surface], durations: Sequence[int], loop: bool = True) -> int:
+        """Get the id of the clip with these frames and durations, registering it if new"""
+        if not frames:
+            return EMPTY_CLIP
+        clip = AnimationClip(frames, durations, loop)
+        key = (clip.frames, clip.durations, clip.loop)
+        clip_id = self._ids.get(key)
+        if clip_id is None:
+            clip_id = len(self._clips)
+            self._clips.append(clip)
+            self._ids[key] = clip_id
+            self._tables = None
+        return clip_id
+
+    def define(self, name: str, frames: Sequence[pygame.Surface], durations: Sequence[int], loop: bool = True) -> int:
+        """Register a clip under a name and get its id"""
+        clip_id = self.clip_for(frames, durations, loop)
+        self._names[name] = clip_id
+        return clip_id
+
+    def id_of(self, name: str) -> int:
+        """Get the id of a named clip"""
+        return self._names[name]
+
+    def retimed(self, clip_id: int, duration: int) -> int:
+        """Get a clip with the same frames but every frame lasting ``duration`` ticks"""
+        key = (clip_id, duration)
+        retimed_id = self._retimed.get(key)
+        if retimed_id is None:
+            clip = self._clips[clip_id]
+            retimed_id = self.clip_for(clip.frames, [duration] * len(clip), clip.loop)
+            self._retimed[key] = retimed_id
+        return retimed_id
+
+    @property
+    def durations_table(self) -> np.ndarray:
+        """Per-frame durations of every clip, padded into a (clips, max frames) array"""
+        return self._build_tables()[0]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Frame count of every clip"""
+        return self._build_tables()[1]
+
+    def _build_tables(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._tables is None:
+            width = max(1, max(len(clip) for clip in self._clips))
+            durations = np.ones((len(self._clips), width), dtype=np.int64)
+            lengths = np.zeros(len(self._clips), dtype=np.int64)
+            for clip_id, clip in enumerate(self._clips):
+                durations[clip_id, :len(clip)] = clip.durations
+                lengths[clip_id] = len(clip)
+            self._tables = (durations, lengths)
+        return self._tables
+
+
+# Shared clip library
+clips: ClipLibrary = ClipLibrary()
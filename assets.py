@@ -0,0 +1,263 @@
+import os
+import pygame
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from config import ASSET_LOADER_WORKERS, SPRITE_PACK_PATH, SPRITE_SCALE
+
+# Logical sprite names mapped to their files relative to the repo root
+SPRITE_PATHS: Dict[str, str] = {
+    "batarang": "sprites/batarang.png",
+    "batman_idle": "sprites/batman_idle.png",
+    "batman_walking_down1": "sprites/batman_walking_down1.png",
+    "batman_walking_down2": "sprites/batman_walking_down2.png",
+    "batman_walking_up1": "sprites/batman_walking_up1.png",
+    "batman_walking_up2": "sprites/batman_walking_up2.png",
+    "batman_walking_left1": "sprites/batman_walking_left1.png",
+    "batman_walking_left2": "sprites/batman_walking_left2.png",
+    "batman_walking_right1": "sprites/batman_walking_right1.png",
+    "batman_walking_right2": "sprites/batman_walking_right2.png",
+    "bob1": "sprites/bob/bob1.png",
+    "bob2": "sprites/bob/bob2.png",
+    "gun": "sprites/gun/gun.png",
+    "gunfire1": "sprites/gun/gunfire1.png",
+    "gunfire2": "sprites/gun/gunfire2.png",
+    "sludge": "sprites/sludge/sludge.png",
+    "sludge_neutral1": "sprites/sludge/sludge_neutral1.png",
+    "sludge_neutral2": "sprites/sludge/sludge_neutral2.png",
+    "sludge_sword_0": "sprites/sludge/sludge_sword_0.png",
+    "sludge_sword_20": "sprites/sludge/sludge_sword_20.png",
+    "sludge_sword_45": "sprites/sludge/sludge_sword_45.png",
+    "sludge_sword_70": "sprites/sludge/sludge_sword_70.png",
+    "sludge_sword_90": "sprites/sludge/sludge_sword_90.png",
+    "sludge_sword_-25": "sprites/sludge/sludge_sword_-25.png",
+    "sludge_sword_-45": "sprites/sludge/sludge_sword_-45.png",
+    "sludge_sword_-65": "sprites/sludge/sludge_sword_-65.png",
+    "sludge_sword_-90": "sprites/sludge/sludge_sword_-90.png",
+}
+
+# A sprite as drawn: (name, scale, mirrored horizontally)
+Variant = Tuple[str, float, bool]
+
+# Variants baked into the sprite pack ready-made, besides every sprite at its original size
+PACKED_VARIANTS: List[Variant] = [
+    (name, SPRITE_SCALE, False)
+    for name in (
+        "batman_idle",
+        "batman_walking_down1",
+        "batman_walking_down2",
+        "batman_walking_up1",
+        "batman_walking_up2",
+        "batman_walking_left1",
+        "batman_walking_left2",
+        "batman_walking_right1",
+        "batman_walking_right2",
+    )
+]
+
+# Pending-load key of the sprite pack, loaded as one job instead of per-sprite files
+PACK_KEY: str = "<sprite pack>"
+
+ASSET_ROOT: str = os.path.dirname(os.path.abspath(__file__))
+
+
+class AssetRegistry:
+    """Loads every sprite at most once per process and hands out shared Surfaces.
+
+    Surfaces returned by the registry are shared by every caller and must be
+    treated as read-only: copy them before drawing onto them.
+
+    ``load_async`` decodes image files on a thread pool, which needs no
+    display; ``poll`` then converts finished images to the display format on
+    the main thread, a few per frame. ``get`` on a sprite that is still
+    decoding simply waits for it, so callers never see a half-loaded asset.
+
+    With a sprite pack (see ``sprite_pack.py``) every sprite and baked
+    variant is a subsurface of one atlas read from a single file; sprites
+    missing from the pack still load from their own files.
+    """
+
+    def __init__(self, paths: Dict[str, str], root: str = ASSET_ROOT) -> None:
+        self.paths: Dict[str, str] = dict(paths)
+        self.root: str = root
+        self._surfaces: Dict[str, pygame.Surface] = {}
+        self._scaled: Dict[Variant, pygame.Surface] = {}
+        self.pack = None  # Loaded SpritePack, if any
+
+        # Background decoding: sprite name -> (decoded Surface, file size) future
+        self._pending: Dict[str, "Future[Tuple[pygame.Surface, int]]"] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.queued: int = 0  # Sprites ever handed to the loader threads
+
+        # Load statistics
+        self.load_count: int = 0
+        self.bytes_read: int = 0
+        self.surface_bytes: int = 0
+        self.hits: int = 0
+
+    def path_for(self, name: str) -> str:
+        """Get the absolute file path of a logical sprite name"""
+        if name not in self.paths:
+            raise KeyError(f"Unknown sprite '{name}'")
+        return os.path.join(self.root, self.paths[name])
+
+    def get(self, name: str) -> pygame.Surface:
+        """Get the shared, alpha-converted Surface for a sprite, loading it on first use"""
+        surface = self._surfaces.get(name)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        if name in self._pending:
+            return self._finish(name)
+        if PACK_KEY in self._pending:
+            self._finish(PACK_KEY)
+            return self.get(name)
+
+        path = self.path_for(name)
+        surface = pygame.image.load(path).convert_alpha()
+        self.load_count += 1
+        self.bytes_read += os.path.getsize(path)
+        self._store(name, surface)
+        return surface
+
+    def get_scaled(self, name: str, scale: float, mirrored: bool = False) -> pygame.Surface:
+        """Get a shared copy of a sprite scaled by the given factor (and optionally mirrored)"""
+        if PACK_KEY in self._pending:
+            self._finish(PACK_KEY)
+        key = (name, scale, mirrored)
+        surface = self._scaled.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        base = self.get(name)
+        size = (int(base.get_width() * scale), int(base.get_height() * scale))
+        surface = pygame.transform.scale(base, size)
+        if mirrored:
+            surface = pygame.transform.flip(surface, True, False)
+        self._scaled[key] = surface
+        self.surface_bytes += surface.get_bytesize() * size[0] * size[1]
+        return surface
+
+    def get_many(self, names: List[str]) -> List[pygame.Surface]:
+        """Get several sprites in order"""
+        return [self.get(name) for name in names]
+
+    def preload(self, names: List[str] = None) -> None:
+        """Load the given sprites (or every known sprite) ahead of time"""
+        for name in names if names is not None else self.paths:
+            self.get(name)
+
+    def load_pack(self, path: str = SPRITE_PACK_PATH) -> None:
+        """Load every sprite from the sprite pack now, rebaking it first if the sprites changed"""
+        from sprite_pack import load_or_bake
+
+        self._install_pack(load_or_bake(path, self.root), os.path.getsize(self._resolve(path)))
+
+    def load_async(
+        self, names: List[str] = None, workers: int = ASSET_LOADER_WORKERS, pack: Optional[str] = SPRITE_PACK_PATH
+    ) -> None:
+        """Start loading the given sprites (or everything, from ``pack`` if given) on background threads"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-loader")
+        if names is None and pack is not None and self.pack is None and PACK_KEY not in self._pending:
+            self._pending[PACK_KEY] = self._executor.submit(self._read_pack, self._resolve(pack))
+            self.queued += 1
+            return
+        for name in names if names is not None else self.paths:
+            if name not in self._surfaces and name not in self._pending:
+                self._pending[name] = self._executor.submit(self._decode, self.path_for(name))
+                self.queued += 1
+
+    def poll(self, limit: int = None) -> int:
+        """Convert up to ``limit`` (default: all) decoded sprites on the main thread; returns how many"""
+        finished = [name for name, future in self._pending.items() if future.done()]
+        for name in finished[:limit]:
+            self._finish(name)
+        if not self._pending and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        return len(finished[:limit])
+
+    @property
+    def loading(self) -> bool:
+        """Check whether background loads are still outstanding"""
+        return bool(self._pending)
+
+    @property
+    def progress(self) -> float:
+        """Get the finished fraction of everything queued with ``load_async``"""
+        if not self.queued:
+            return 1.0
+        return 1.0 - len(self._pending) / self.queued
+
+    def stats(self) -> dict:
+        """Get load counters so callers can confirm restarts do no disk I/O"""
+        return {
+            "loaded": len(self._surfaces),
+            "scaled": len(self._scaled),
+            "load_count": self.load_count,
+            "bytes_read": self.bytes_read,
+            "surface_bytes": self.surface_bytes,
+            "hits": self.hits,
+            "pending": len(self._pending),
+        }
+
+    def clear(self) -> None:
+        """Drop every cached Surface (e.g. after the display mode changes)"""
+        self._surfaces.clear()
+        self._scaled.clear()
+        self.pack = None
+        self.surface_bytes = 0
+
+    @staticmethod
+    def _decode(path: str) -> Tuple[pygame.Surface, int]:
+        """Read and decode one image file (runs on a loader thread)"""
+        return pygame.image.load(path), os.path.getsize(path)
+
+    def _read_pack(self, path: str):
+        """Load (rebaking if stale) the sprite pack (runs on a loader thread)"""
+        from sprite_pack import load_or_bake
+
+        return load_or_bake(path, self.root), os.path.getsize(path)
+
+    def _install_pack(self, pack, size: int) -> None:
+        """Convert a loaded pack's atlas and serve its frames as subsurfaces"""
+        pack = pack.converted()
+        self.pack = pack
+        self.load_count += 1
+        self.bytes_read += size
+        for (name, scale, mirrored), surface in pack.subsurfaces().items():
+            if scale == 1.0 and not mirrored:
+                self._surfaces[name] = surface
+            else:
+                self._scaled[(name, scale, mirrored)] = surface
+        width, height = pack.surface.get_size()
+        self.surface_bytes += pack.surface.get_bytesize() * width * height
+
+    def _resolve(self, path: str) -> str:
+        return path if os.path.isabs(path) else os.path.join(self.root, path)
+
+    def _finish(self, name: str) -> Optional[pygame.Surface]:
+        """Wait for a background load and convert it to the display format"""
+        if name == PACK_KEY:
+            try:
+                self._install_pack(*self._pending.pop(name).result())
+            except (OSError, ValueError):
+                pass  # Unreadable or unwritable pack: sprites load from their own files instead
+            return None
+        surface, size = self._pending.pop(name).result()
+        surface = surface.convert_alpha()
+        self.load_count += 1
+        self.bytes_read += size
+        self._store(name, surface)
+        return surface
+
+    def _store(self, name: str, surface: pygame.Surface) -> None:
+        self._surfaces[name] = surface
+        width, height = surface.get_size()
+        self.surface_bytes += surface.get_bytesize() * width * height
+
+
+# Shared registry used by the whole game
+assets: AssetRegistry = AssetRegistry(SPRITE_PATHS)
@@ -0,0 +1,190 @@
+"""Headless performance benchmarks for the gameplay simulation.
+
+Runs each scenario on the SDL dummy video driver with scripted input and
+writes machine-readable results. Pass a stored baseline to fail (exit code 1)
+when any scenario regressed by more than the tolerance:
+
+    python benchmark.py --output results.json
+    python benchmark.py --baseline baseline.json --tolerance 0.15
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import numpy as np
+import pygame
+from typing import Dict, List, Optional
+
+from config import GAME_BG, SCREEN_HEIGHT, SCREEN_WIDTH
+from headless import ScriptedInput, init_headless
+
+# Metrics compared against the baseline, and whether bigger numbers are better
+METRICS: Dict[str, bool] = {
+    "ticks_per_sec": True,
+    "frames_per_sec": True,
+    "update_ms_mean": False,
+    "update_ms_p95": False,
+    "draw_ms_mean": False,
+    "draw_ms_p95": False,
+}
+
+
+class Scenario:
+    """A reproducible workload: N enemies and M batarangs kept in flight"""
+
+    def __init__(self, name: str, enemies: int, projectiles: int, ticks: int = 600, warmup_ticks: int = 60) -> None:
+        self.name: str = name
+        self.enemies: int = enemies
+        self.projectiles: int = projectiles
+        self.ticks: int = ticks
+        self.warmup_ticks: int = warmup_ticks
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("baseline_2_enemies", 2, 0),
+    Scenario("enemies_500", 500, 0),
+    Scenario("enemies_2000", 2000, 0),
+    Scenario("projectiles_400", 2, 400),
+    Scenario("mixed_1000_enemies_200_projectiles", 1000, 200),
+]
+
+
+def run_scenario(display: pygame.Surface, scenario: Scenario, seed: int = 0) -> dict:
+    """Simulate and draw a scenario, timing the update and draw phase of every tick"""
+    # Imported here so the display exists before any sprite is converted
+    from renderer import DirtyRectRenderer
+    from world import GameWorld
+
+    world = GameWorld(seed=seed)
+    # Scenarios fix the enemy count themselves, so waves never spawn
+    world.spawner.spawns_per_tick = 0
+    while len(world.enemies) < scenario.enemies:
+        world.spawn_enemy()
+    # Keep the workload constant: nobody dies during a benchmark
+    world.player.health = 10 ** 9
+    for enemy in world.enemies:
+        enemy.health = 10 ** 9
+
+    script = ScriptedInput(seed=seed, fire_interval=0)
+    fire_rng = random.Random(seed)
+    renderer = DirtyRectRenderer(display, GAME_BG, painter=world.background.paint)
+    update_times: List[float] = []
+    draw_times: List[float] = []
+
+    for tick in range(scenario.warmup_ticks + scenario.ticks):
+        # Top the projectile pool back up to the scenario's count
+        while len(world.projectile_pool) < scenario.projectiles:
+            world.fire(fire_rng.randrange(SCREEN_WIDTH), fire_rng.randrange(SCREEN_HEIGHT))
+
+        inputs = script.next(tick)
+        start = time.perf_counter()
+        world.update(inputs)
+        updated = time.perf_counter()
+        renderer.begin_frame(world.camera.offset())
+        world.draw(renderer)
+        renderer.present()
+        drawn = time.perf_counter()
+
+        if tick >= scenario.warmup_ticks:
+            update_times.append(updated - start)
+            draw_times.append(drawn - updated)
+
+    update_ms = np.array(update_times) * 1000.0
+    draw_ms = np.array(draw_times) * 1000.0
+    return {
+        "enemies": scenario.enemies,
+        "projectiles": scenario.projectiles,
+        "ticks": scenario.ticks,
+        "ticks_per_sec": scenario.ticks / (update_ms.sum() / 1000.0),
+        "frames_per_sec": scenario.ticks / ((update_ms.sum() + draw_ms.sum()) / 1000.0),
+        "update_ms_mean": float(update_ms.mean()),
+        "update_ms_p95": float(np.percentile(update_ms, 95)),
+        "draw_ms_mean": float(draw_ms.mean()),
+        "draw_ms_p95": float(np.percentile(draw_ms, 95)),
+    }
+
+
+def run_benchmarks(scenarios: List[Scenario], seed: int = 0) -> dict:
+    """Run every scenario and collect the results with environment metadata"""
+    display = init_headless()
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": seed,
+        },
+        "scenarios": {},
+    }
+    for scenario in scenarios:
+        results["scenarios"][scenario.name] = run_scenario(display, scenario, seed)
+    pygame.quit()
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Get a description of every metric that regressed beyond the tolerance"""
+    regressions = []
+    for name, metrics in results["scenarios"].items():
+        reference = baseline.get("scenarios", {}).get(name)
+        if reference is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            if metric not in reference:
+                continue
+            old, new = reference[metric], metrics[metric]
+            if higher_is_better:
+                regressed = new < old * (1.0 - tolerance)
+            else:
+                regressed = new > old * (1.0 + tolerance)
+            if regressed:
+                regressions.append(f"{name}.{metric}: {old:.3f} -> {new:.3f}")
+    return regressions
+
+
+def print_results(results: dict) -> None:
+    print(f"{'scenario':<40}{'ticks/s':>10}{'fps':>10}{'update ms':>12}{'draw ms':>10}")
+    for name, metrics in results["scenarios"].items():
+        print(
+            f"{name:<40}{metrics['ticks_per_sec']:>10.0f}{metrics['frames_per_sec']:>10.0f}"
+            f"{metrics['update_ms_mean']:>12.3f}{metrics['draw_ms_mean']:>10.3f}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run headless gameplay benchmarks")
+    parser.add_argument("--output", default="benchmark_results.json", help="where to write the results")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed relative regression")
+    parser.add_argument("--scenario", action="append", help="only run the named scenario(s)")
+    parser.add_argument("--ticks", type=int, help="override the measured ticks per scenario")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    scenarios = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+    if args.ticks:
+        for scenario in scenarios:
+            scenario.ticks = args.ticks
+
+    results = run_benchmarks(scenarios, args.seed)
+    print_results(results)
+    with open(args.output, "w") as results_file:
+        json.dump(results, results_file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.tolerance)
+        if regressions:
+            print("Performance regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+import pygame
+from typing import List, Tuple
+
+from config import SCREEN_HEIGHT, SCREEN_WIDTH, WORLD_HEIGHT, WORLD_WIDTH
+
+
+class Camera:
+    """Screen-sized window onto a world larger than the screen.
+
+    ``scroll`` is the world position of the screen's top-left corner. The
+    camera follows its target once per simulation tick, so converting input
+    from screen to world coordinates is deterministic, and drawing
+    interpolates between the last two ticks like every other position.
+    """
+
+    def __init__(
+        self,
+        view_size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT),
+        world_size: Tuple[int, int] = (WORLD_WIDTH, WORLD_HEIGHT),
+    ) -> None:
+        self.view_width, self.view_height = view_size
+        self.world_width, self.world_height = world_size
+        self.scroll: List[int] = [0, 0]
+        self.previous_scroll: Tuple[int, int] = (0, 0)
+
+    def follow(self, rect: pygame.Rect) -> None:
+        """Center the view on a rect, stopping at the edges of the world"""
+        self.previous_scroll = (self.scroll[0], self.scroll[1])
+        self.scroll[0] = min(max(rect.centerx - self.view_width // 2, 0), self.world_width - self.view_width)
+        self.scroll[1] = min(max(rect.centery - self.view_height // 2, 0), self.world_height - self.view_height)
+
+    def snap(self, rect: pygame.Rect) -> None:
+        """Jump straight to a rect without interpolating from the old position"""
+        self.follow(rect)
+        self.previous_scroll = (self.scroll[0], self.scroll[1])
+
+    def offset(self, alpha: float = 1.0) -> Tuple[int, int]:
+        """Get the scroll to draw with, interpolated between the last two ticks"""
+        previous_x, previous_y = self.previous_scroll
+        return (
+            round(previous_x + (self.scroll[0] - previous_x) * alpha),
+            round(previous_y + (self.scroll[1] - previous_y) * alpha),
+        )
+
+    def view_rect(self, alpha: float = 1.0) -> pygame.Rect:
+        """Get the part of the world on screen, in world coordinates"""
+        return pygame.Rect(self.offset(alpha), (self.view_width, self.view_height))
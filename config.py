@@ -16,4 +16,76 @@ ORANGE: tuple[int, int, int] = (255, 140, 0)  # Warning/alert color
 
 # Game settings
 FPS: int = 60
-SPRITE_SCALE: float = 2.5  # Scale factor to make sprites bigger 
\ No newline at end of file
+SPRITE_SCALE: float = 2.5  # Scale factor to make sprites bigger
+PLAYER_SPEED: int = 5  # Pixels per simulation tick
+
+# Rotation cache settings
+ROTATION_STEPS: int = 72  # Pre-rendered angles per sprite (72 steps = 5 degrees)
+ROTATION_CACHE_BYTES: int = 32 * 1024 * 1024  # Memory bound for all cached rotations
+
+# Renderer settings
+DIRTY_RECT_FULL_REDRAW_RATIO: float = 0.35  # Fall back to a full redraw above this share of the screen
+
+# Collision settings
+SPATIAL_HASH_CELL_SIZE: int = 128  # Grid cell size in pixels, roughly the largest sprite
+
+# Projectile settings
+PROJECTILE_POOL_CAPACITY: int = 512  # Maximum batarangs in flight; extra shots are dropped
+PROJECTILE_SPEED: float = 15.0
+
+# Simulation timing
+TICK_RATE: int = 60  # Fixed simulation ticks per second, independent of rendering
+MAX_TICKS_PER_FRAME: int = 32  # Drop simulation time beyond this to avoid a spiral of death
+FAST_FORWARD_SCALE: float = 4.0  # Simulation speed while fast-forwarding
+RENDER_MODE: str = "throttled"  # "throttled" (capped at MAX_RENDER_FPS), "uncapped" or "vsync"
+MAX_RENDER_FPS: int = FPS
+
+# Profiler settings
+PROFILER_HISTORY: int = 600  # Frames kept in the ring buffer (10 seconds at 60 FPS)
+PROFILER_EXPORT_PATH: str = "profile.json"  # Written on exit when profiling was on (.json or .csv)
+
+# Text cache settings
+TEXT_CACHE_SIZE: int = 256  # Rendered text Surfaces kept before the least recently used are evicted
+
+# Scheduler settings
+TIMER_WHEEL_SLOTS: int = 256  # Buckets in the simulation timer wheel (delays beyond this take extra laps)
+
+# Recording settings
+RECORDING_PATH: str = "last_session.rec"  # Input log of the last session, replayable with replay.py
+
+# Wave settings
+ENEMY_POOL_CAPACITY: int = 256  # Enemies preallocated per game; waves never grow beyond this
+SPAWNS_PER_TICK: int = 4  # Most enemies spawned in one tick, the rest of a wave waits its turn
+FIRST_WAVE_SIZE: int = 2
+WAVE_SIZE_GROWTH: int = 2  # Extra enemies in each following wave
+WAVE_DELAY_MS: int = 3000  # Pause between clearing a wave and the next one starting
+
+# World settings
+WORLD_WIDTH: int = SCREEN_WIDTH * 3  # The arena scrolls; the screen shows a window onto it
+WORLD_HEIGHT: int = SCREEN_HEIGHT * 3
+
+# Tilemap settings
+MAP_PATH: str = "maps/gotham.map"
+CHUNK_TILES: int = 8  # Chunks are CHUNK_TILES x CHUNK_TILES tiles, pre-rendered into one Surface
+CHUNK_CACHE_SIZE: int = 48  # Chunk Surfaces kept (512x512 tiles: ~1 MB each); must cover one screen
+CHUNK_BUILDS_PER_FRAME: int = 2  # Chunks near the view rendered ahead of time each frame
+
+# Enemy settings
+ENEMY_TARGET_SPREAD: int = 300  # Enemies aim up to this many pixels to either side of the player, per axis
+
+# Pathfinding settings
+FLOW_DIRECT_MARGIN: int = 1  # Extra map cells, beyond the target spread, where enemies steer straight at the player
+
+# Asset loading settings
+ASSET_LOADER_WORKERS: int = 4  # Threads decoding sprite files in the background at startup
+SPRITE_PACK_PATH: str = "sprites/sprites.pack"  # Baked atlas of every sprite, rebuilt when the PNGs change
+SPRITE_PACK_WIDTH: int = 1024  # Atlas width in pixels; the height grows to fit
+
+# Startup settings
+STARTUP_BUDGET_MS: float = 1000.0  # Interpreter start to first home screen frame (python main.py --startup-report)
+
+# Menu settings
+MENU_WAKE_MS: int = 250  # Idle menus sleep in event.wait, waking at least this often for background work
+
+# HUD settings
+HUD_HEIGHT: int = 110  # Height of the HUD layer across the top of the screen
@@ -0,0 +1,52 @@
+import pygame
+from typing import Sequence, Tuple
+
+
+class InputState:
+    """Everything the simulation reads from the keyboard and mouse in one tick.
+
+    Live play builds it from the devices with ``from_devices``; headless runs
+    and replays construct it directly, so the simulation never polls pygame.
+    """
+
+    __slots__ = ("left", "right", "up", "down", "mouse_pos", "clicks")
+
+    def __init__(
+        self,
+        left: bool = False,
+        right: bool = False,
+        up: bool = False,
+        down: bool = False,
+        mouse_pos: Tuple[int, int] = (0, 0),
+        clicks: Sequence[Tuple[int, int]] = (),
+    ) -> None:
+        self.left: bool = left
+        self.right: bool = right
+        self.up: bool = up
+        self.down: bool = down
+        self.mouse_pos: Tuple[int, int] = mouse_pos
+        self.clicks: Sequence[Tuple[int, int]] = clicks  # Left-click positions since the last tick
+
+    def translated(self, dx: int, dy: int) -> "InputState":
+        """Get a copy with the mouse and click positions shifted (e.g. from screen to world coordinates)"""
+        return InputState(
+            self.left,
+            self.right,
+            self.up,
+            self.down,
+            (self.mouse_pos[0] + dx, self.mouse_pos[1] + dy),
+            [(x + dx, y + dy) for x, y in self.clicks],
+        )
+
+    @classmethod
+    def from_devices(cls, clicks: Sequence[Tuple[int, int]] = ()) -> "InputState":
+        """Read the live keyboard and mouse state"""
+        pressed_keys: pygame.key.ScancodeWrapper = pygame.key.get_pressed()
+        return cls(
+            left=pressed_keys[pygame.K_a],
+            right=pressed_keys[pygame.K_d],
+            up=pressed_keys[pygame.K_w],
+            down=pressed_keys[pygame.K_s],
+            mouse_pos=pygame.mouse.get_pos(),
+            clicks=clicks,
+        )
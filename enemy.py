@@ -1,10 +1,11 @@
 import math
 import random
 import pygame
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
-from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from animation import EMPTY_CLIP, clips
+from config import ENEMY_TARGET_SPREAD, WORLD_HEIGHT, WORLD_WIDTH
 from weapon import Weapon, EnemySword
 
 class Enemy(pygame.sprite.Sprite, ABC):
@@ -19,24 +20,28 @@ class Enemy(pygame.sprite.Sprite, ABC):
         weapon: Weapon,
         enemy_img: pygame.Surface,
         walking_images: List[pygame.Surface] = None,
+        rng: Optional[random.Random] = None,
     ) -> None:
         super().__init__()
         
+        # Seeded by the world so sessions can be replayed exactly
+        self.rng: random.Random = rng if rng is not None else random.Random()
+
         self.image: pygame.Surface = enemy_img
         self.rect: pygame.Rect = self.image.get_rect()
 
-        # Use fixed fullscreen dimensions for positioning since game only runs in fullscreen
+        # Start anywhere in the world
         self.rect.center = (
-            random.randint(40, SCREEN_WIDTH - 40),
-            random.randint(40, SCREEN_HEIGHT - 40),
+            self.rng.randint(40, WORLD_WIDTH - 40),
+            self.rng.randint(40, WORLD_HEIGHT - 40),
         )
 
         self.health: int = health
         self.attack_power: int = attack_power
         self.name: str = name
         self.reset_offset = 0
-        self.offset_x = random.randrange(-300, 300)
-        self.offset_y = random.randrange(-300, 300)
+        self.offset_x = self.rng.randrange(-ENEMY_TARGET_SPREAD, ENEMY_TARGET_SPREAD)
+        self.offset_y = self.rng.randrange(-ENEMY_TARGET_SPREAD, ENEMY_TARGET_SPREAD)
 
         # Targeting behavior variables
         self.target_speed: float = 2.0  # Movement speed
@@ -44,34 +49,62 @@ class Enemy(pygame.sprite.Sprite, ABC):
 
         # Weapon and animation variables - to be implemented by subclasses
         self.weapon: Weapon = weapon
-        self.weapon_imgs: List[pygame.Surface] = []
+        self.weapon_imgs: Tuple[pygame.Surface, ...] = ()  # Frames of the current swing clip
         self.current_weapon_img: Optional[pygame.Surface] = None
+        self.swing_clips: Dict[str, int] = {}  # Attack direction -> swing clip id
 
         # Attack animation variables
         self.attack_range: int = 500
         self.is_attacking: bool = False
         self.attack_animation_speed: int = 8  # Frames per animation update
-        self.attack_frame_counter: int = 0
+        self.attack_clip: int = EMPTY_CLIP
+        self.attack_frame_counter: int = 0  # Cursor into the attack clip
         self.attack_animation_index: int = 0
         self.attack_direction: str = "right"  # Default attack direction
 
-        # Store original images for when not attacking
-        self.original_enemy_image: pygame.Surface = self.image.copy()
+        # Store original images for when not attacking (shared frames, never drawn onto)
+        self.original_enemy_image: pygame.Surface = self.image
         self.original_weapon_img: Optional[pygame.Surface] = None
         
         # Walking animation variables
-        self.walking_state: int = 0  # 0 or 1 for two walking states
+        self.walk_clip: int = EMPTY_CLIP
+        self.walking_state: int = 0  # Cursor into the walk clip
         self.walking_animation_speed: int = 15  # Frames per walking state change
         self.walking_frame_counter: int = 0
-        self.walking_images: List[pygame.Surface] = []  # Two walking state images
+        self.walking_images: Tuple[pygame.Surface, ...] = ()  # Frames of the walk clip
         self.is_moving: bool = False
+
+        # Shared path towards the target around obstacles; None steers straight at it
+        self.flow_field = None
+
+        # Set when the enemy's per-frame state is owned by an EnemySwarm
+        self.swarm = None
+        self.swarm_index: int = -1
         
         # Setup walking images if provided
         if walking_images and len(walking_images) >= 2:
-            self.walking_images = walking_images[:2]
-            # Set initial image to first walking state
-            self.image = self.walking_images[0].copy()
-            self.original_enemy_image = self.walking_images[0].copy()
+            self.set_walking_images(walking_images)
+
+    def respawn(self, health: int) -> None:
+        """Bring a pooled enemy back at a new random position with fresh state"""
+        self.health = health
+        self.rect.center = (
+            self.rng.randint(40, WORLD_WIDTH - 40),
+            self.rng.randint(40, WORLD_HEIGHT - 40),
+        )
+        self.offset_x = self.rng.randrange(-ENEMY_TARGET_SPREAD, ENEMY_TARGET_SPREAD)
+        self.offset_y = self.rng.randrange(-ENEMY_TARGET_SPREAD, ENEMY_TARGET_SPREAD)
+        self.reset_offset = 0
+
+        # Restart both animations from their first frame
+        self.is_attacking = False
+        self.attack_frame_counter = 0
+        self.attack_animation_index = 0
+        self.walking_state = 0
+        self.walking_frame_counter = 0
+        self.is_moving = False
+        self.image = self.walking_images[0] if self.walking_images else self.original_enemy_image
+        self.current_weapon_img = self.original_weapon_img
 
     @abstractmethod
     def setup_weapon_animations(self) -> None:
@@ -89,17 +122,46 @@ class Enemy(pygame.sprite.Sprite, ABC):
         pass
     
     def get_weapon_animation_frames(self) -> dict:
-        """Get all available weapon animation frames from the weapon"""
-        if hasattr(self.weapon, 'animation_swing_left') and hasattr(self.weapon, 'animation_swing_right'):
-            return {
-                "left": self.weapon.animation_swing_left.copy(),
-                "right": self.weapon.animation_swing_right.copy()
-            }
-        return {}
+        """Get the (shared, read-only) frames of every swing clip by direction"""
+        return {direction: clips[clip_id].frames for direction, clip_id in self.swing_clips.items()}
     
     def set_attack_direction(self, direction: str) -> None:
-        """Set the attack direction - to be implemented by subclasses"""
-        pass
+        """Switch to the swing clip for a direction, if this enemy has one"""
+        if direction not in self.swing_clips:
+            return
+        self.attack_direction = direction
+        self.attack_clip = self.swing_clips[direction]
+        self.weapon_imgs = clips[self.attack_clip].frames
+
+        # Reset animation state and update current weapon image
+        if self.weapon_imgs:
+            self.current_weapon_img = self.weapon_imgs[0]
+            # Also update the original weapon image for restoration after attack
+            self.original_weapon_img = self.weapon_imgs[0]
+
+    def set_swing_clips(self, left_clip: int, right_clip: int) -> None:
+        """Set the swing clips played when attacking to the left and to the right"""
+        self.swing_clips = {"left": left_clip, "right": right_clip}
+        self.set_attack_direction(self.attack_direction)
+        if self.swarm is not None:
+            self.swarm.set_swing_clips(self.swarm_index, left_clip, right_clip)
+
+    def set_walk_clip(self, clip_id: int) -> None:
+        """Play a different walk clip, keeping the current cursor"""
+        clip = clips[clip_id]
+        self.walk_clip = clip_id
+        self.walking_images = clip.frames
+        self.walking_animation_speed = clip.durations[0] if clip.durations else self.walking_animation_speed
+        if self.walking_state >= len(clip):
+            self.walking_state = 0
+        if self.walking_images:
+            # Update current image if not attacking
+            if not self.is_attacking:
+                self.image = self.walking_images[self.walking_state]
+            # Update original enemy image
+            self.original_enemy_image = self.walking_images[0]
+        if self.swarm is not None:
+            self.swarm.set_walk_clip(self.swarm_index, clip_id)
     
     def get_attack_direction(self) -> str:
         """Get the current attack direction"""
@@ -110,15 +172,16 @@ class Enemy(pygame.sprite.Sprite, ABC):
         if not self.is_moving or not self.walking_images:
             return
             
+        clip = clips[self.walk_clip]
         self.walking_frame_counter += 1
         
-        if self.walking_frame_counter >= self.walking_animation_speed:
+        if self.walking_frame_counter >= clip.durations[self.walking_state]:
             self.walking_frame_counter = 0
-            # Toggle between walking states 0 and 1
-            self.walking_state = 1 - self.walking_state
+            # Advance to the next walking frame
+            self.walking_state = (self.walking_state + 1) % len(clip)
             # Update the enemy image to the current walking state
-            if self.walking_images and not self.is_attacking:
-                self.image = self.walking_images[self.walking_state].copy()
+            if not self.is_attacking:
+                self.image = clip.frames[self.walking_state]
     
     def set_moving_state(self, moving: bool) -> None:
         """Set whether the enemy is currently moving"""
@@ -128,7 +191,7 @@ class Enemy(pygame.sprite.Sprite, ABC):
             self.walking_state = 0
             self.walking_frame_counter = 0
             if not self.is_attacking:
-                self.image = self.walking_images[0].copy()
+                self.image = self.walking_images[0]
     
     def get_walking_state(self) -> int:
         """Get the current walking state (0 or 1)"""
@@ -136,30 +199,31 @@ class Enemy(pygame.sprite.Sprite, ABC):
     
     def set_walking_animation_speed(self, speed: int) -> None:
         """Set the walking animation speed (lower = faster)"""
-        self.walking_animation_speed = max(1, speed)  # Ensure speed is at least 1
+        speed = max(1, speed)  # Ensure speed is at least 1
+        if self.walking_images:
+            # Clips are shared, so switch to a retimed copy of the walk clip instead of editing it
+            self.set_walk_clip(clips.retimed(self.walk_clip, speed))
+        self.walking_animation_speed = speed
     
     def reset_walking_animation(self) -> None:
         """Reset walking animation to initial state"""
+        if self.swarm is not None:
+            self.swarm.reset_walking_animation(self.swarm_index)
         self.walking_state = 0
         self.walking_frame_counter = 0
         if self.walking_images and not self.is_attacking:
-            self.image = self.walking_images[0].copy()
+            self.image = self.walking_images[0]
     
     def set_walking_images(self, walking_images: List[pygame.Surface]) -> None:
         """Set walking images after initialization"""
         if walking_images and len(walking_images) >= 2:
-            self.walking_images = walking_images[:2]
-            # Update current image if not attacking
-            if not self.is_attacking:
-                self.image = self.walking_images[self.walking_state].copy()
-            # Update original enemy image
-            self.original_enemy_image = self.walking_images[0].copy()
+            self.set_walk_clip(clips.clip_for(walking_images[:2], [self.walking_animation_speed] * 2))
         else:
             print("Warning: Invalid walking images provided. Need at least 2 images.")
     
     def get_walking_images(self) -> List[pygame.Surface]:
         """Get the current walking images"""
-        return self.walking_images.copy() if self.walking_images else []
+        return list(self.walking_images)
 
     def is_within_attack_range(self) -> bool:
         """Check if the enemy is within attack range of the target"""
@@ -177,27 +241,24 @@ class Enemy(pygame.sprite.Sprite, ABC):
         if not self.is_attacking:
             return
 
+        clip = clips[self.attack_clip]
         self.attack_frame_counter += 1
 
-        if self.attack_frame_counter >= self.attack_animation_speed:
+        if self.attack_frame_counter >= clip.durations[self.attack_animation_index]:
             self.attack_frame_counter = 0
             self.attack_animation_index += 1
 
             # Loop through animation frames
-            if self.attack_animation_index >= len(self.weapon_imgs):
+            if self.attack_animation_index >= len(clip):
                 self.attack_animation_index = 0
                 # End attack after one complete cycle
                 self.is_attacking = False
                 # Restore to current walking state or original image
                 if self.walking_images and self.is_moving:
-                    self.image = self.walking_images[self.walking_state].copy()
+                    self.image = self.walking_images[self.walking_state]
                 else:
-                    self.image = self.original_enemy_image.copy()
-                self.current_weapon_img = (
-                    self.original_weapon_img.copy()
-                    if self.original_weapon_img
-                    else None
-                )
+                    self.image = self.original_enemy_image
+                self.current_weapon_img = self.original_weapon_img
             else:
                 # Update to next weapon frame
                 self.current_weapon_img = self.weapon_imgs[self.attack_animation_index]
@@ -230,9 +291,12 @@ class Enemy(pygame.sprite.Sprite, ABC):
 
     def move(self) -> None:
         """Move the enemy towards the target with offset behavior"""
-        # Use fixed fullscreen dimensions since game only runs in fullscreen
-        current_width: int = SCREEN_WIDTH
-        current_height: int = SCREEN_HEIGHT
+        if self.swarm is not None:
+            return  # Advanced in bulk by EnemySwarm.step
+
+        # Enemies roam the whole world, not just the screen
+        current_width: int = WORLD_WIDTH
+        current_height: int = WORLD_HEIGHT
 
         if self.target:
             # Calculate distance to hero
@@ -246,9 +310,9 @@ class Enemy(pygame.sprite.Sprite, ABC):
             self.update_attack_animation()
 
             if self.reset_offset == 0:
-                self.offset_x = random.randrange(-300, 300)
-                self.offset_y = random.randrange(-300, 300)
-                self.reset_offset = random.randrange(120, 150)
+                self.offset_x = self.rng.randrange(-ENEMY_TARGET_SPREAD, ENEMY_TARGET_SPREAD)
+                self.offset_y = self.rng.randrange(-ENEMY_TARGET_SPREAD, ENEMY_TARGET_SPREAD)
+                self.reset_offset = self.rng.randrange(120, 150)
             else:
                 self.reset_offset -= 1
 
@@ -270,6 +334,13 @@ class Enemy(pygame.sprite.Sprite, ABC):
             elif target_with_offset_y < self.rect.centery:
                 move_y = -self.target_speed
 
+            # Far from the target, follow the flow field around obstacles instead
+            if self.flow_field is not None:
+                flow_x, flow_y = self.flow_field.sample(self.rect.centerx, self.rect.centery)
+                if flow_x or flow_y:
+                    move_x = flow_x * self.target_speed
+                    move_y = flow_y * self.target_speed
+
             # Apply movement
             self.rect.move_ip(move_x, move_y)
             
@@ -284,20 +355,22 @@ class Enemy(pygame.sprite.Sprite, ABC):
             print("No target set for enemy!")
             self.set_moving_state(False)
 
-        # Keep enemy within screen bounds using fixed dimensions
+        # Keep enemy within world bounds
         self.rect.clamp_ip(pygame.Rect(0, 0, current_width, current_height))
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw the enemy and its weapon"""
-        # Draw the enemy
-        surface.blit(self.image, self.rect)
+    def sprites(self, offset: Tuple[int, int] = (0, 0)) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Get the enemy's and its weapon's images at their screen positions, back to front"""
+        offset_x, offset_y = offset
+        # The enemy
+        sprites = [(self.image, (self.rect.x - offset_x, self.rect.y - offset_y))]
 
-        # Draw the weapon if it exists
+        # The weapon if it exists
         if self.current_weapon_img:
             # Position the weapon relative to the enemy
             weapon_rect = self.current_weapon_img.get_rect()
-            weapon_rect.center = self.rect.center
-            surface.blit(self.current_weapon_img, weapon_rect)
+            weapon_rect.center = (self.rect.centerx - offset_x, self.rect.centery - offset_y)
+            sprites.append((self.current_weapon_img, weapon_rect.topleft))
+        return sprites
 
 
 class SludgeEnemy(Enemy):
@@ -311,9 +384,10 @@ class SludgeEnemy(Enemy):
         weapon: EnemySword,
         enemy_img: pygame.Surface,
         walking_images: List[pygame.Surface] = None,
+        rng: Optional[random.Random] = None,
     ) -> None:
         # Call parent constructor with sludge-specific name
-        super().__init__(health, attack_power, "Sludge", target, weapon, enemy_img)
+        super().__init__(health, attack_power, "Sludge", target, weapon, enemy_img, rng=rng)
         
         # Setup weapon animations using the weapon's stored frames
         self.setup_weapon_animations()
@@ -321,46 +395,35 @@ class SludgeEnemy(Enemy):
         # Setup walking animations with provided images
         self.setup_walking_animations(walking_images)
         
-        # Set initial weapon image
-        if self.weapon_imgs:
-            self.current_weapon_img = self.weapon_imgs[0]
-            self.original_weapon_img = self.weapon_imgs[0].copy()
-
     def setup_weapon_animations(self) -> None:
-        """Setup weapon animations using the weapon's stored animation frames"""
+        """Setup swing clips from the weapon's stored animation frames"""
         if isinstance(self.weapon, EnemySword):
+            swing_left = self.weapon.animation_swing_left
+            swing_right = self.weapon.animation_swing_right
             # Initialize with right swing as default
-            self.weapon_imgs = self.weapon.animation_swing_right.copy()
             self.attack_direction = "right"
+            self.set_swing_clips(
+                clips.clip_for(swing_left, [self.attack_animation_speed] * len(swing_left)),
+                clips.clip_for(swing_right, [self.attack_animation_speed] * len(swing_right)),
+            )
         else:
             # Fallback for non-sword weapons
-            self.weapon_imgs = []
+            self.swing_clips = {}
+            self.weapon_imgs = ()
     
     def setup_walking_animations(self, walking_images: List[pygame.Surface] = None) -> None:
         """Setup walking animations using provided images or fallback to default"""
         if walking_images and len(walking_images) >= 2:
-            # Use provided walking images
-            self.walking_images = walking_images[:2]  # Take first two images
-            # Set initial image to first walking state
-            self.image = self.walking_images[0].copy()
-            self.original_enemy_image = self.walking_images[0].copy()
+            # Use provided walking images (first two) as the walk clip
+            self.set_walking_images(walking_images)
         else:
             # Fallback to using the current image for both states
-            self.walking_images = [self.image, self.image]
+            self.set_walking_images([self.image, self.image])
             print("Warning: SludgeEnemy using fallback walking images. Provide walking_images parameter for proper animation.")
 
     def get_attack_animation_frames(self) -> List[pygame.Surface]:
         """Get the attack animation frames for sludge enemy"""
-        return self.weapon_imgs.copy()
-    
-    def get_weapon_animation_frames(self) -> dict:
-        """Get all available weapon animation frames from the EnemySword"""
-        if isinstance(self.weapon, EnemySword):
-            return {
-                "left": self.weapon.animation_swing_left.copy(),
-                "right": self.weapon.animation_swing_right.copy()
-            }
-        return {}
+        return list(self.weapon_imgs)
     
     def get_sword_animation_info(self) -> dict:
         """Get detailed information about the sword animations"""
@@ -375,6 +438,8 @@ class SludgeEnemy(Enemy):
     
     def get_walking_animation_info(self) -> dict:
         """Get detailed information about the walking animations"""
+        if self.swarm is not None:
+            self.swarm.sync_state(self)
         return {
             "walking_frames": len(self.walking_images),
             "current_walking_state": self.walking_state,
@@ -383,22 +448,6 @@ class SludgeEnemy(Enemy):
             "walking_animation_speed": self.walking_animation_speed
         }
 
-    def set_attack_direction(self, direction: str) -> None:
-        """Set the attack direction and update weapon images accordingly"""
-        if isinstance(self.weapon, EnemySword):
-            if direction == "left":
-                self.weapon_imgs = self.weapon.animation_swing_left.copy()
-                self.attack_direction = "left"
-            elif direction == "right":
-                self.weapon_imgs = self.weapon.animation_swing_right.copy()
-                self.attack_direction = "right"
-            
-            # Reset animation state and update current weapon image
-            if self.weapon_imgs:
-                self.current_weapon_img = self.weapon_imgs[0]
-                # Also update the original weapon image for restoration after attack
-                self.original_weapon_img = self.weapon_imgs[0].copy()
-
     def get_sword_angle(self) -> float:
         """Get the current sword angle based on animation frame"""
         if not self.is_attacking or not self.weapon_imgs:
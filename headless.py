@@ -0,0 +1,55 @@
+import math
+import os
+import random
+import pygame
+from typing import Tuple
+
+from config import SCREEN_HEIGHT, SCREEN_WIDTH
+from controls import InputState
+
+
+def init_headless(size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT)) -> pygame.Surface:
+    """Start pygame on the SDL dummy drivers and open an offscreen display of the game's size"""
+    # Must be set before the display is initialised
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    return pygame.display.set_mode(size)
+
+
+class ScriptedInput:
+    """Deterministic stand-in for the keyboard and mouse.
+
+    The player walks a fixed square (right, down, left, up) while the mouse
+    sweeps around the screen, and a batarang is thrown at a pseudo-random
+    point every ``fire_interval`` ticks.
+    """
+
+    WALK_PATTERN: Tuple[Tuple[bool, bool, bool, bool], ...] = (
+        # left, right, up, down
+        (False, True, False, False),
+        (False, False, False, True),
+        (True, False, False, False),
+        (False, False, True, False),
+    )
+
+    def __init__(self, seed: int = 0, fire_interval: int = 10, walk_ticks: int = 90) -> None:
+        self.rng: random.Random = random.Random(seed)
+        self.fire_interval: int = fire_interval
+        self.walk_ticks: int = walk_ticks
+
+    def next(self, tick: int) -> InputState:
+        """Get the input for a simulation tick"""
+        left, right, up, down = self.WALK_PATTERN[(tick // self.walk_ticks) % len(self.WALK_PATTERN)]
+
+        angle = tick * 0.05
+        mouse_pos = (
+            int(SCREEN_WIDTH / 2 + math.cos(angle) * SCREEN_WIDTH / 3),
+            int(SCREEN_HEIGHT / 2 + math.sin(angle) * SCREEN_HEIGHT / 3),
+        )
+
+        clicks = ()
+        if self.fire_interval > 0 and tick % self.fire_interval == 0:
+            clicks = ((self.rng.randrange(SCREEN_WIDTH), self.rng.randrange(SCREEN_HEIGHT)),)
+
+        return InputState(left, right, up, down, mouse_pos, clicks)
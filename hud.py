@@ -0,0 +1,112 @@
+import pygame
+from abc import ABC, abstractmethod
+from typing import Callable, Hashable, List
+
+from text_cache import text_cache
+from config import DARK_GRAY, GOLD, HUD_HEIGHT, RED, SCREEN_WIDTH, WHITE
+
+# Value no widget source ever returns, so every widget renders on its first update
+_UNSET = object()
+
+
+class HudWidget(ABC):
+    """One HUD element, bound to a value it re-renders from only when that value changes"""
+
+    def __init__(self, rect: pygame.Rect, source: Callable[[], Hashable]) -> None:
+        self.rect: pygame.Rect = rect  # Region of the HUD layer the widget owns
+        self.source: Callable[[], Hashable] = source
+        self.value = _UNSET
+
+    def refresh(self, layer: pygame.Surface) -> bool:
+        """Re-render into the layer if the bound value changed; returns whether it did"""
+        value = self.source()
+        if value == self.value:
+            return False
+        self.value = value
+        layer.fill((0, 0, 0, 0), self.rect)
+        self.render(layer, value)
+        return True
+
+    @abstractmethod
+    def render(self, layer: pygame.Surface, value) -> None:
+        """Draw the widget for a value inside its rect"""
+        pass
+
+
+class HealthBar(HudWidget):
+    """Red bar with a "HEALTH" label above it, scaled to a 0-100 value"""
+
+    def __init__(self, x: int, y: int, source: Callable[[], int], width: int = 200, height: int = 25) -> None:
+        self.bar_rect: pygame.Rect = pygame.Rect(x, y, width, height)
+        label_height = text_cache.font(24).get_linesize()
+        super().__init__(self.bar_rect.inflate(0, label_height + 5).move(0, -(label_height + 5) // 2), source)
+
+    def render(self, layer: pygame.Surface, value: int) -> None:
+        # Draw background rectangle (empty health bar)
+        pygame.draw.rect(layer, DARK_GRAY, self.bar_rect)
+        pygame.draw.rect(layer, WHITE, self.bar_rect, 2)  # White border
+
+        # Calculate current health percentage and fill the bar
+        current_health_width = int(self.bar_rect.width * value / 100.0)
+        if current_health_width > 0:
+            pygame.draw.rect(layer, RED, (self.bar_rect.x, self.bar_rect.y, current_health_width, self.bar_rect.height))
+
+        # Add "HEALTH" label above the bar
+        label_surface = text_cache.render("HEALTH", 24, WHITE)
+        label_rect = label_surface.get_rect(centerx=self.bar_rect.centerx, bottom=self.bar_rect.top - 5)
+        layer.blit(label_surface, label_rect)
+
+
+class Counter(HudWidget):
+    """A label followed by a number, e.g. "WAVE 3" """
+
+    def __init__(self, x: int, y: int, label: str, source: Callable[[], int], width: int = 320, size: int = 36) -> None:
+        super().__init__(pygame.Rect(x, y, width, text_cache.font(size).get_linesize()), source)
+        self.label: str = label
+        self.size: int = size
+
+    def render(self, layer: pygame.Surface, value: int) -> None:
+        # Numbers change too often to keep in the shared text cache
+        text = text_cache.font(self.size).render(f"{self.label} {value}", True, GOLD)
+        layer.blit(text, self.rect)
+
+
+class Hud:
+    """Heads-up display kept in one transparent layer across the top of the screen.
+
+    Each frame every widget compares its bound value with the one it last
+    drew and only changed widgets are re-rendered into the layer. The layer
+    is then blitted in one call; ``draw`` returns the widget rects so the
+    dirty-rect renderer restores and presents just those regions.
+    """
+
+    def __init__(self, widgets: List[HudWidget], height: int = HUD_HEIGHT) -> None:
+        self.widgets: List[HudWidget] = widgets
+        self.layer: pygame.Surface = pygame.Surface((SCREEN_WIDTH, height), pygame.SRCALPHA)
+        self.rects: List[pygame.Rect] = [widget.rect.clip(self.layer.get_rect()) for widget in widgets]
+        self.renders: int = 0  # Widget re-renders so far
+
+    @classmethod
+    def for_world(cls, world) -> "Hud":
+        """Build the gameplay HUD: health, score, wave and remaining batarangs"""
+        pool = world.projectile_pool
+        return cls(
+            [
+                HealthBar(SCREEN_WIDTH - 220, 20, lambda: world.player.health),
+                Counter(20, 10, "SCORE", lambda: world.enemies_defeated),
+                Counter(20, 45, "WAVE", lambda: world.spawner.wave),
+                Counter(20, 80, "BATARANGS", lambda: pool.capacity - len(pool), size=24),
+            ]
+        )
+
+    def update(self) -> int:
+        """Re-render the widgets whose values changed; returns how many did"""
+        changed = sum(widget.refresh(self.layer) for widget in self.widgets)
+        self.renders += changed
+        return changed
+
+    def draw(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        """Bring the layer up to date and blit it; returns the screen regions it covers"""
+        self.update()
+        surface.blit(self.layer, (0, 0))
+        return self.rects
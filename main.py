@@ -1,337 +1,303 @@
+# Imported first so the startup report covers every other import
+from startup import startup
+
+import argparse
 import pygame, sys
 from pygame.locals import *
-import random, time
-from typing import List
+import time
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from enemy import Enemy, SludgeEnemy
-from player import Player
-from screens import HomeScreen, OptionsScreen, PauseMenu, GameOverScreen
+from assets import assets
+from profiler import profiler
 from config import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
-    RED,
-    DARK_GRAY,
     GAME_BG,
-    FPS,
-    WHITE,
-    BATMAN_BLUE,
+    FAST_FORWARD_SCALE,
+    MAX_RENDER_FPS,
+    PROFILER_EXPORT_PATH,
+    RECORDING_PATH,
+    RENDER_MODE,
+    STARTUP_BUDGET_MS,
 )
-from weapon import EnemySword, PlayerProjectile, WeaponType
-
-# Walking Animation System:
-# - Each enemy now has two walking states that alternate while moving
-# - Walking images are loaded once and passed to enemy constructors
-# - Enemies automatically switch between walking states every 15 frames while moving
-# - Walking animations work alongside attack animations without conflicts
-
-
-def display_health(display: pygame.Surface, player: Player) -> None:
-    """Display the player's health as a red status bar on the top right of the screen"""
-    # Health bar dimensions and position
-    bar_width = 200
-    bar_height = 25
-    bar_x = SCREEN_WIDTH - bar_width - 20
-    bar_y = 20
-
-    # Draw background rectangle (empty health bar)
-    background_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-    pygame.draw.rect(display, DARK_GRAY, background_rect)
-    pygame.draw.rect(display, WHITE, background_rect, 2)  # White border
-
-    # Calculate current health percentage and fill the bar
-    health_percentage = player.health / 100.0
-    current_health_width = int(bar_width * health_percentage)
-
-    # Draw the red health bar
-    if current_health_width > 0:
-        health_rect = pygame.Rect(bar_x, bar_y, current_health_width, bar_height)
-        pygame.draw.rect(display, RED, health_rect)
-
-    # Add "HEALTH" label above the bar
-    font = pygame.font.Font(None, 24)
-    label_text = "HEALTH"
-    label_surface = font.render(label_text, True, WHITE)
-    label_rect = label_surface.get_rect()
-    label_rect.centerx = bar_x + bar_width // 2
-    label_rect.bottom = bar_y - 5
-
-    display.blit(label_surface, label_rect)
-
-
-def run_game() -> str:
-    player: Player = Player("Absolute")
-    main_display_scroll = [0, 0]
-    
-    # Load sludge sword base image
-    sludge_sword_img: pygame.Surface = pygame.image.load(
-        "sprites/sludge/sludge_sword_0.png"
-    )
-    
-    # Load sludge enemy base image
-    sludge_img: pygame.Surface = pygame.image.load("sprites/sludge/sludge.png")
-    
-    # Load walking animation images for sludge enemy
-    sludge_walking_img1: pygame.Surface = pygame.image.load("sprites/sludge/sludge_neutral1.png").convert_alpha()
-    sludge_walking_img2: pygame.Surface = pygame.image.load("sprites/sludge/sludge_neutral2.png").convert_alpha()
-    sludge_walking_images: List[pygame.Surface] = [sludge_walking_img1, sludge_walking_img2]
-    
-    bob_walking_img1: pygame.Surface = pygame.image.load("sprites/bob/bob1.png").convert_alpha()
-    bob_walking_img2: pygame.Surface = pygame.image.load("sprites/bob/bob2.png").convert_alpha()
-    bob_walking_images: List[pygame.Surface] = [bob_walking_img1, bob_walking_img2]
-    
-    
-    
-
-
-    # Load all sword animation frames
-    sludge_sword_imgs_swing_left: List[pygame.Surface] = [
-        pygame.image.load("sprites/sludge/sludge_sword_20.png").convert_alpha(),
-        pygame.image.load("sprites/sludge/sludge_sword_45.png").convert_alpha(),
-        pygame.image.load("sprites/sludge/sludge_sword_70.png").convert_alpha(),
-        pygame.image.load("sprites/sludge/sludge_sword_90.png").convert_alpha(),
-    ]
-
-    sludge_sword_imgs_swing_right: List[pygame.Surface] = [
-        pygame.image.load("sprites/sludge/sludge_sword_-25.png").convert_alpha(),
-        pygame.image.load("sprites/sludge/sludge_sword_-45.png").convert_alpha(),
-        pygame.image.load("sprites/sludge/sludge_sword_-65.png").convert_alpha(),
-        pygame.image.load("sprites/sludge/sludge_sword_-90.png").convert_alpha(),
-    ]
-
-    sludge_sword: EnemySword = EnemySword(
-        "sludge_sword",
-        WeaponType.SWORD,
-        3,
-        sludge_sword_img,
-        sludge_sword_imgs_swing_left,
-        sludge_sword_imgs_swing_right,
-    )
-
-    first_enemy_sludge: SludgeEnemy = SludgeEnemy(
-        100, 3, player, sludge_sword, sludge_img, sludge_walking_images
-    )
-    first_enemy_bob: SludgeEnemy = SludgeEnemy(
-        100, 3, player, sludge_sword, sludge_img, bob_walking_images
-    )
-
-    enemies: pygame.sprite.Group = pygame.sprite.Group()
-    enemies.add(first_enemy_sludge)
-    enemies.add(first_enemy_bob)
 
-    all_sprites: pygame.sprite.Group = pygame.sprite.Group()
-    all_sprites.add(player)
-    all_sprites.add(first_enemy_sludge)
-    all_sprites.add(first_enemy_bob)
-
-
-    # Create pause menu and game over screen
-    pause_menu = PauseMenu()
-    game_over_screen = GameOverScreen()
-
-    player_projectiles: List[PlayerProjectile] = []
-    batarang: pygame.Surface = pygame.image.load("sprites/batarang.png")
-
-    # Invincibility frame system
-    invincibility_duration = 200  # 1 second in milliseconds
-    last_damage_time = 0
-    damaged_enemies = set()  # Track which enemies have recently damaged the player
-
-    while True:
-        # Cycles through all events occuring
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                pygame.quit()
-                return "quit"
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:
-                    new_projectile = PlayerProjectile(
-                        player.rect.centerx,
-                        player.rect.centery,
-                        mouse_x,
-                        mouse_y,
-                        batarang,
-                    )
-                    player_projectiles.append(new_projectile)
-
-            # Handle pause menu with ESC key
-            elif event.type == KEYDOWN:
-                if event.key == K_ESCAPE:
-                    # Show pause menu
-                    pause_action = pause_menu.run(DISPLAYSURF, FramePerSec)
-                    if pause_action == "quit":
+# Gameplay modules are imported when PLAY is chosen, keeping them off the cold-start path
+if TYPE_CHECKING:
+    from replay import InputRecorder
+    from world import GameWorld
+
+
+class Game:
+    """The application: display, menus and the game loop, started by ``main``
+
+    Importing this module has no side effects. Screens are built when first
+    shown and gameplay modules are imported when a game starts, so the home
+    screen comes up after little more than importing pygame.
+    """
+
+    def __init__(self) -> None:
+        self.clock: pygame.time.Clock = pygame.time.Clock()
+        self.display: Optional[pygame.Surface] = None
+        self._screens: dict = {}
+
+    def open_display(self) -> pygame.Surface:
+        """Start pygame and open the fullscreen display"""
+        pygame.init()
+
+        # Start in fullscreen mode only
+        if RENDER_MODE == "vsync":
+            # Vsync needs a scaled renderer; fall back to a plain fullscreen window without it
+            try:
+                self.display = pygame.display.set_mode(
+                    (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN | pygame.SCALED, vsync=1
+                )
+            except pygame.error:
+                self.display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
+        else:
+            self.display = pygame.display.set_mode(
+                (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN
+            )
+        pygame.display.set_caption("The Dark Night - Home Screen")
+        return self.display
+
+    def screen(self, name: str):
+        """Get a menu screen by class name, building it on first use"""
+        screen = self._screens.get(name)
+        if screen is None:
+            import screens
+
+            screen = self._screens[name] = getattr(screens, name)()
+        return screen
+
+    def run(self, startup_report: bool = False) -> int:
+        """Show the menus and play until the player quits; returns the process exit code
+
+        With ``startup_report`` the game quits after the first home screen
+        frame and prints how long each part of the cold start took.
+        """
+        startup.mark("imports")
+        self.open_display()
+        startup.mark("display")
+
+        # Decode gameplay sprites in the background; the menus are up before they are needed
+        assets.load_async()
+        startup.mark("assets")
+
+        home_screen = self.screen("HomeScreen")
+        on_first_frame = self._report_startup if startup_report else None
+
+        # Main menu loop
+        while True:
+            # Show home screen
+            action = home_screen.run(self.display, self.clock, on_first_frame)
+            on_first_frame = None
+            if startup_report:
+                return 0 if startup.total_ms <= STARTUP_BUDGET_MS else 1
+
+            if action == "play":
+                # Wait for any sprites still loading in the background
+                if self.screen("LoadingScreen").run(self.display, self.clock) == "quit":
+                    return 0
+
+                # Start the game
+                while True:  # Loop for restart functionality
+                    game_result = self.run_game()
+                    if profiler.frames_recorded:
+                        profiler.export(PROFILER_EXPORT_PATH)
+                    if game_result == "quit":
                         pygame.quit()
-                        return "quit"
-                    elif pause_action == "home":
-                        return "home"  # Return to home screen
-                    elif pause_action == "resume":
-                        continue  # Continue the game
-                # Add Tab key to quit the game
-                elif event.key == K_TAB:
+                        return 0
+                    elif game_result == "home":
+                        break  # Exit restart loop and go back to home screen
+                    elif game_result == "restart":
+                        continue  # Continue the restart loop to start a new game
+            elif action == "options":
+                # Show options screen
+                options_action = self.screen("OptionsScreen").run(self.display, self.clock)
+                if options_action == "quit":
                     pygame.quit()
-                    return "quit"
-                # Add Backspace key to quit the game
-                elif event.key == K_BACKSPACE:
+                    return 0
+                elif options_action == "back":
+                    continue  # Go back to home screen
+            elif action == "quit":
+                # Quit the game
+                pygame.quit()
+                return 0
+
+    def _report_startup(self) -> None:
+        """Print the cold-start breakdown once the home screen is on screen, then quit"""
+        startup.mark("first_frame")
+        print(startup.report(STARTUP_BUDGET_MS))
+        pygame.event.post(pygame.event.Event(QUIT))
+
+    def run_game(self) -> str:
+        """Play one game from a fresh world; returns the action chosen when it ends"""
+        from replay import InputRecorder
+        from world import GameWorld
+
+        world = GameWorld()
+        # Every tick's input is recorded so the session can be replayed with replay.py
+        recorder = InputRecorder(world.seed)
+        try:
+            return self.play(world, recorder)
+        finally:
+            recorder.save(RECORDING_PATH, world)
+
+    def play(self, world: "GameWorld", recorder: "InputRecorder") -> str:
+        from controls import InputState
+        from enemy import SludgeEnemy
+        from hud import Hud
+        from renderer import DirtyRectRenderer
+        from screens import GameOverScreen, PauseMenu
+        from timestep import FixedTimestep
+
+        enemies: pygame.sprite.Group = world.enemies
+
+        # Create pause menu and game over screen
+        pause_menu = PauseMenu()
+        game_over_screen = GameOverScreen()
+
+        hud = Hud.for_world(world)
+
+        # Dirty-rect renderer: only regions touched by sprites are repainted from the map and presented
+        renderer = DirtyRectRenderer(self.display, GAME_BG, painter=world.background.paint)
+
+        # Fixed-timestep simulation: ticks run at TICK_RATE however fast frames are drawn
+        timestep = FixedTimestep()
+        last_frame_time = time.perf_counter()
+        pending_clicks: List[Tuple[int, int]] = []
+
+        while True:
+            profiler.begin_frame()
+
+            # Cycles through all events occuring
+            mouse_x, mouse_y = pygame.mouse.get_pos()
+            for event in pygame.event.get():
+                if event.type == QUIT:
                     pygame.quit()
                     return "quit"
-                # Add Q key to quit the game
-                elif event.key == K_q:
+
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    if event.button == 1:
+                        # Thrown on the next simulation tick
+                        pending_clicks.append((mouse_x, mouse_y))
+
+                # Handle pause menu with ESC key
+                elif event.type == KEYDOWN:
+                    if event.key == K_ESCAPE:
+                        # Show pause menu
+                        pause_action = pause_menu.run(self.display, self.clock)
+                        if pause_action == "quit":
+                            pygame.quit()
+                            return "quit"
+                        elif pause_action == "home":
+                            return "home"  # Return to home screen
+                        elif pause_action == "resume":
+                            renderer.invalidate()  # The menu drew over the whole screen
+                            timestep.reset()  # Time spent paused is not simulated
+                            last_frame_time = time.perf_counter()
+                            continue  # Continue the game
+                    # Add Tab key to quit the game
+                    elif event.key == K_TAB:
+                        pygame.quit()
+                        return "quit"
+                    # Add Backspace key to quit the game
+                    elif event.key == K_BACKSPACE:
+                        pygame.quit()
+                        return "quit"
+                    # Add Q key to quit the game
+                    elif event.key == K_q:
+                        pygame.quit()
+                        return "quit"
+                    # Add F3 key to toggle the frame profiler overlay
+                    elif event.key == K_F3:
+                        profiler.toggle()
+                        renderer.invalidate()
+                    # Add F key to toggle fast-forward
+                    elif event.key == K_f:
+                        timestep.time_scale = 1.0 if timestep.time_scale != 1.0 else FAST_FORWARD_SCALE
+                    # Add W key to test walking animation speed
+                    elif event.key == K_w:
+                        for enemy in enemies:
+                            if isinstance(enemy, SludgeEnemy):
+                                current_speed = enemy.walking_animation_speed
+                                new_speed = max(1, current_speed - 5)  # Decrease speed (faster animation)
+                                enemy.set_walking_animation_speed(new_speed)
+                    # Add S key to test walking animation speed (slower)
+                    elif event.key == K_s:
+                        for enemy in enemies:
+                            if isinstance(enemy, SludgeEnemy):
+                                current_speed = enemy.walking_animation_speed
+                                new_speed = current_speed + 5  # Increase speed (slower animation)
+                                enemy.set_walking_animation_speed(new_speed)
+                    # Add R key to reset walking animations
+                    elif event.key == K_r:
+                        for enemy in enemies:
+                            if isinstance(enemy, SludgeEnemy):
+                                enemy.reset_walking_animation()
+
+            profiler.mark("events")
+
+            # Run as many fixed simulation ticks as the elapsed real time covers
+            now = time.perf_counter()
+            for _ in range(timestep.advance(now - last_frame_time)):
+                inputs = InputState.from_devices(pending_clicks)
+                recorder.record(inputs)
+                world.update(inputs)
+                pending_clicks = []
+                if world.is_over():
+                    break
+            last_frame_time = now
+
+            # Restore the background only where sprites were drawn last frame (everywhere once it scrolls)
+            renderer.begin_frame(world.camera.offset(timestep.alpha))
+            profiler.mark("clear")
+
+            # Re-draws all Sprites between the last two simulation ticks
+            world.draw(renderer, timestep.alpha)
+
+            # Health, score, wave and ammo; widgets re-render only when their values change
+            for rect in hud.draw(self.display):
+                renderer.mark(rect)
+
+            # Frame timing overlay (F3)
+            overlay_rect = profiler.draw_overlay(self.display)
+            if overlay_rect:
+                renderer.mark(overlay_rect)
+            profiler.mark("hud")
+
+            # Check if player is dead
+            if world.is_over():
+                game_over_action = game_over_screen.run(self.display, self.clock)
+                if game_over_action == "quit":
                     pygame.quit()
                     return "quit"
-                # Add W key to test walking animation speed
-                elif event.key == K_w:
-                    for enemy in enemies:
-                        if isinstance(enemy, SludgeEnemy):
-                            current_speed = enemy.walking_animation_speed
-                            new_speed = max(1, current_speed - 5)  # Decrease speed (faster animation)
-                            enemy.set_walking_animation_speed(new_speed)
-                # Add S key to test walking animation speed (slower)
-                elif event.key == K_s:
-                    for enemy in enemies:
-                        if isinstance(enemy, SludgeEnemy):
-                            current_speed = enemy.walking_animation_speed
-                            new_speed = current_speed + 5  # Increase speed (slower animation)
-                            enemy.set_walking_animation_speed(new_speed)
-                # Add R key to reset walking animations
-                elif event.key == K_r:
-                    for enemy in enemies:
-                        if isinstance(enemy, SludgeEnemy):
-                            enemy.reset_walking_animation()
-
-            # Handle invincibility timer events
-            elif (
-                event.type >= pygame.USEREVENT and event.type < pygame.USEREVENT + 1000
-            ):
-                # Remove enemies from damaged set after invincibility period
-                for enemy in list(damaged_enemies):
-                    if event.type == pygame.USEREVENT + hash(enemy) % 1000:
-                        damaged_enemies.discard(enemy)
-
-        DISPLAYSURF.fill(GAME_BG)
-
-        # Moves and Re-draws all Sprites
-        for entity in all_sprites:
-            if isinstance(entity, Player):
-                entity.update()
-                entity.handle_weapons(DISPLAYSURF)
-                # entity.handle_weapons(DISPLAYSURF)  # Commented out until weapon system is fully implemented
-                DISPLAYSURF.blit(entity.image, entity.rect)
-            elif isinstance(entity, Enemy):
-                entity.move()
-                entity.draw(DISPLAYSURF)
+                elif game_over_action == "home":
+                    return "home"  # Return to home screen
+                elif game_over_action == "restart":
+                    return "restart"  # Restart the game
+
+            renderer.present()
+            profiler.mark("present")
+            profiler.end_frame()
+
+            # Pace rendering only; the simulation rate is set by the timestep
+            if RENDER_MODE == "throttled":
+                self.clock.tick(MAX_RENDER_FPS)
             else:
-                DISPLAYSURF.blit(entity.image, entity.rect)
-
-        for projectile in player_projectiles:
-            projectile.fire_player_projectile(DISPLAYSURF)
-
-        # Clean up projectiles that go off-screen
-        player_projectiles = [
-            p
-            for p in player_projectiles
-            if 0 <= p.x <= SCREEN_WIDTH and 0 <= p.y <= SCREEN_HEIGHT
-        ]
-
-        # Display player health on top right
-        display_health(DISPLAYSURF, player)
-        
-        # Display walking animation debug info (optional - can be removed later)
-        font = pygame.font.Font(None, 24)
-        for enemy in enemies:
-            if isinstance(enemy, SludgeEnemy):
-                walking_info = enemy.get_walking_animation_info()
-                debug_text = f"Walking: {walking_info['current_walking_state']} | Moving: {walking_info['is_moving']}"
-                debug_surface = font.render(debug_text, True, WHITE)
-                debug_rect = debug_surface.get_rect()
-                debug_rect.topleft = (10, 10)
-                DISPLAYSURF.blit(debug_surface, debug_rect)
-                break  # Only show for first enemy
-
-        if pygame.sprite.spritecollideany(player, enemies):
-            current_time = pygame.time.get_ticks()
-
-            # Get the enemy that collided with the player
-            for enemy in enemies:
-                if pygame.sprite.collide_rect(player, enemy):
-                    # Check if enough time has passed since last damage and enemy hasn't recently damaged player
-                    if (
-                        current_time - last_damage_time >= invincibility_duration
-                        and enemy not in damaged_enemies
-                    ):
-                        # Reduce player health by enemy's attack power
-                        player.health -= enemy.attack_power
-                        # Ensure health doesn't go below 0
-                        if player.health < 0:
-                            player.health = 0
-
-                        # Update invincibility tracking
-                        last_damage_time = current_time
-                        damaged_enemies.add(enemy)
-
-                        # Remove enemy from damaged set after invincibility period
-                        pygame.time.set_timer(
-                            pygame.USEREVENT + hash(enemy) % 1000,
-                            invincibility_duration,
-                        )
-
-                    break  # Only process one enemy per collision check
-
-        # Check if player is dead
-        if player.health <= 0:
-            game_over_action = game_over_screen.run(DISPLAYSURF, FramePerSec)
-            if game_over_action == "quit":
-                pygame.quit()
-                return "quit"
-            elif game_over_action == "home":
-                return "home"  # Return to home screen
-            elif game_over_action == "restart":
-                return "restart"  # Restart the game
-
-        pygame.display.update()
-        FramePerSec.tick(FPS)
+                self.clock.tick()
 
 
-# Main game loop
-pygame.init()
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="The Dark Night")
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="quit after the first home screen frame and print the cold-start timing breakdown",
+    )
+    args = parser.parse_args(argv)
+    return Game().run(startup_report=args.startup_report)
 
-FramePerSec: pygame.time.Clock = pygame.time.Clock()
 
-# Start in fullscreen mode only
-DISPLAYSURF: pygame.Surface = pygame.display.set_mode(
-    (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN
-)
-pygame.display.set_caption("The Dark Night - Home Screen")
-
-# Create screens
-home_screen = HomeScreen()
-options_screen = OptionsScreen()
-
-# Main menu loop
-while True:
-    # Show home screen
-    action = home_screen.run(DISPLAYSURF, FramePerSec)
-
-    if action == "play":
-        # Start the game
-        while True:  # Loop for restart functionality
-            game_result = run_game()
-            if game_result == "quit":
-                pygame.quit()
-                sys.exit()
-            elif game_result == "home":
-                break  # Exit restart loop and go back to home screen
-            elif game_result == "restart":
-                continue  # Continue the restart loop to start a new game
-    elif action == "options":
-        # Show options screen
-        options_action = options_screen.run(DISPLAYSURF, FramePerSec)
-        if options_action == "quit":
-            pygame.quit()
-            sys.exit()
-        elif options_action == "back":
-            continue  # Go back to home screen
-    elif action == "quit":
-        # Quit the game
-        pygame.quit()
-        sys.exit()
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+import math
+import numpy as np
+from typing import List, Optional, Tuple
+
+from config import ENEMY_TARGET_SPREAD, FLOW_DIRECT_MARGIN
+from tilemap import TileMap
+
+# Neighbour steps (dx, dy); diagonals come last so ties prefer straight moves
+STEPS: List[Tuple[int, int]] = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, 1), (1, -1), (-1, -1)]
+
+UNREACHABLE: int = np.iinfo(np.int32).max
+
+
+def _shifted(grid: np.ndarray, dx: int, dy: int, fill) -> np.ndarray:
+    """Get ``grid`` moved by (dx, dy) cells, so each cell holds the value of the cell it is reached from"""
+    result = np.full_like(grid, fill)
+    rows, columns = grid.shape
+    result[max(dy, 0):rows + min(dy, 0), max(dx, 0):columns + min(dx, 0)] = grid[
+        max(-dy, 0):rows + min(-dy, 0), max(-dx, 0):columns + min(-dx, 0)
+    ]
+    return result
+
+
+class FlowField:
+    """Shared map of the next step towards one target, for every cell of a grid.
+
+    The grid is the tile map: solid tiles block movement and diagonal steps
+    may not cut the corner of a solid tile. ``update`` reruns the
+    breadth-first search from the target only when it enters a new cell, so
+    its cost does not depend on how many enemies follow the field, and
+    ``sample`` is a single array lookup per enemy.
+
+    Cells within ``direct_range`` steps of the target (and cells the search
+    cannot reach) hold no step: there the caller steers straight at the
+    target as before. By default the range covers every point an enemy may
+    aim at (the player plus its random offset), so the field never pulls an
+    enemy towards the player while direct steering pulls it back out.
+    """
+
+    def __init__(self, tilemap: TileMap, direct_range: Optional[int] = None) -> None:
+        self.cell_size: int = tilemap.tile_size
+        self.rows: int = tilemap.rows
+        self.columns: int = tilemap.columns
+        if direct_range is None:
+            direct_range = math.ceil(ENEMY_TARGET_SPREAD / self.cell_size) + FLOW_DIRECT_MARGIN
+        self.direct_range: int = direct_range
+        passable = ~tilemap.solid[tilemap.tiles]
+
+        # enterable[k][y, x]: cell (x, y) can be entered with STEPS[k] (diagonals need both corners open)
+        self._enterable: List[np.ndarray] = []
+        for dx, dy in STEPS:
+            enterable = passable.copy()
+            if dx and dy:
+                enterable &= _shifted(passable, dx, 0, False) & _shifted(passable, 0, dy, False)
+            self._enterable.append(enterable)
+
+        # The search walks a flattened copy with a blocked border, so neighbours never fall off the grid
+        stride = self.columns + 2
+        self._stride: int = stride
+        self._flat_enterable: np.ndarray = np.stack(
+            [np.pad(enterable, 1).ravel() for enterable in self._enterable]
+        )
+        self._flat_steps: np.ndarray = np.array([dy * stride + dx for dx, dy in STEPS], dtype=np.int64)
+        self._step_rows: np.ndarray = np.arange(len(STEPS))[None, :]
+
+        self.distance: np.ndarray = np.full((self.rows, self.columns), UNREACHABLE, dtype=np.int32)
+        self.step_x: np.ndarray = np.zeros((self.rows, self.columns), dtype=np.int64)
+        self.step_y: np.ndarray = np.zeros((self.rows, self.columns), dtype=np.int64)
+        self.target_cell: Tuple[int, int] = (-1, -1)
+        self.rebuilds: int = 0
+
+    def cell_of(self, x: int, y: int) -> Tuple[int, int]:
+        """Get the grid cell containing a world position, clamped to the grid"""
+        return (
+            min(max(x // self.cell_size, 0), self.columns - 1),
+            min(max(y // self.cell_size, 0), self.rows - 1),
+        )
+
+    def update(self, target_x: int, target_y: int) -> bool:
+        """Point the field at a world position; recomputes only if the target changed cells"""
+        cell = self.cell_of(target_x, target_y)
+        if cell == self.target_cell:
+            return False
+        self.target_cell = cell
+        self._search(cell)
+        self._build_steps(cell)
+        self.rebuilds += 1
+        return True
+
+    def sample(self, x: int, y: int) -> Tuple[int, int]:
+        """Get the step (-1, 0 or 1 per axis) to take from a world position; (0, 0) means steer directly"""
+        cell_x, cell_y = self.cell_of(x, y)
+        return int(self.step_x[cell_y, cell_x]), int(self.step_y[cell_y, cell_x])
+
+    def sample_many(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Batch ``sample`` for arrays of world positions"""
+        cell_x = np.clip(x // self.cell_size, 0, self.columns - 1)
+        cell_y = np.clip(y // self.cell_size, 0, self.rows - 1)
+        return self.step_x[cell_y, cell_x], self.step_y[cell_y, cell_x]
+
+    def _search(self, cell: Tuple[int, int]) -> None:
+        """Breadth-first search outwards from the target cell, one whole wavefront at a time"""
+        stride = self._stride
+        distance = np.full((self.rows + 2) * stride, UNREACHABLE, dtype=np.int32)
+        # The target's own cell counts even if it is solid
+        frontier = np.array([(cell[1] + 1) * stride + cell[0] + 1], dtype=np.int64)
+        distance[frontier] = 0
+        steps = 0
+        while frontier.size:
+            steps += 1
+            reached = frontier[:, None] + self._flat_steps[None, :]
+            reached = reached[self._flat_enterable[self._step_rows, reached]]
+            frontier = np.unique(reached[distance[reached] == UNREACHABLE])
+            distance[frontier] = steps
+        self.distance = distance.reshape(self.rows + 2, stride)[1:-1, 1:-1]
+
+    def _build_steps(self, cell: Tuple[int, int]) -> None:
+        """Pick, for every cell, the neighbour closest to the target (straightest line on ties)"""
+        rows, columns = self.rows, self.columns
+        distance = self.distance.astype(np.int64)
+        # Among equally distant neighbours prefer the one nearest the target as the crow flies
+        ys, xs = np.mgrid[0:rows, 0:columns]
+        crow = (xs - cell[0]) ** 2 + (ys - cell[1]) ** 2
+        tie_scale = int(crow.max()) + 1
+        score = np.where(distance == UNREACHABLE, np.iinfo(np.int64).max, distance * tie_scale + crow)
+
+        best = np.full((rows, columns), np.iinfo(np.int64).max, dtype=np.int64)
+        step_x = np.zeros((rows, columns), dtype=np.int64)
+        step_y = np.zeros((rows, columns), dtype=np.int64)
+        for (dx, dy), enterable in zip(STEPS, self._enterable):
+            # Moving by (dx, dy) from a cell enters its neighbour with that same step
+            neighbour = _shifted(np.where(enterable, score, np.iinfo(np.int64).max), -dx, -dy, np.iinfo(np.int64).max)
+            better = neighbour < best
+            best[better] = neighbour[better]
+            step_x[better] = dx
+            step_y[better] = dy
+
+        # Only step downhill, and leave the last few cells to direct steering
+        keep = (best < score) & (distance > self.direct_range) & (distance != UNREACHABLE)
+        self.step_x = np.where(keep, step_x, 0)
+        self.step_y = np.where(keep, step_y, 0)
@@ -1,203 +1,148 @@
 import math
 import pygame
-from typing import Tuple
+from typing import Dict, List, Optional, Tuple
 
-from config import SCREEN_HEIGHT, SCREEN_WIDTH, SPRITE_SCALE
+from animation import clips
+from assets import assets
+from config import PLAYER_SPEED, SPRITE_SCALE, WORLD_HEIGHT, WORLD_WIDTH
+from controls import InputState
+from rotation_cache import rotations
 from weapon import PlayerWeapon, Weapon, WeaponType
 
+# Player animation clips as data: sprite names and how many ticks each frame is shown
+PLAYER_CLIPS: Dict[str, Tuple[Tuple[str, ...], Tuple[int, ...]]] = {
+    "idle": (("batman_idle",), (1,)),
+    "walk_down": (("batman_walking_down1", "batman_walking_down2"), (8, 8)),
+    "walk_up": (("batman_walking_up1", "batman_walking_up2"), (8, 8)),
+    "walk_left": (("batman_walking_left1", "batman_walking_left2"), (8, 8)),
+    "walk_right": (("batman_walking_right1", "batman_walking_right2"), (8, 8)),
+}
+
+# Diagonal steps are shortened to the same length as an axis step; the player
+# carries the fraction of a pixel left over each tick, so on average it moves
+# exactly PLAYER_SPEED pixels per tick in every direction
+DIAGONAL_STEP: float = PLAYER_SPEED / math.sqrt(2)
+
+# Movement direction (x, y) -> (displacement per tick, clip played while moving that way)
+MOVES: Dict[Tuple[int, int], Tuple[Tuple[float, float], str]] = {
+    (0, 0): ((0, 0), "idle"),
+    (0, 1): ((0, PLAYER_SPEED), "walk_down"),
+    (0, -1): ((0, -PLAYER_SPEED), "walk_up"),
+    (-1, 0): ((-PLAYER_SPEED, 0), "walk_left"),
+    (1, 0): ((PLAYER_SPEED, 0), "walk_right"),
+    (-1, 1): ((-DIAGONAL_STEP, DIAGONAL_STEP), "walk_down"),
+    (1, 1): ((DIAGONAL_STEP, DIAGONAL_STEP), "walk_down"),
+    (-1, -1): ((-DIAGONAL_STEP, -DIAGONAL_STEP), "walk_up"),
+    (1, -1): ((DIAGONAL_STEP, -DIAGONAL_STEP), "walk_up"),
+}
+
+# Area the player is kept inside, in world coordinates
+PLAY_AREA: pygame.Rect = pygame.Rect(0, 0, WORLD_WIDTH, WORLD_HEIGHT)
+
+
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
+
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, name: str) -> None:
         super().__init__()
         self.name: str = name
-        batarang: pygame.Surface = pygame.image.load("sprites/batarang.png")
+        batarang: pygame.Surface = assets.get("batarang")
         self.weapon: PlayerWeapon = PlayerWeapon("begining_batarang", WeaponType.SPECIAL, 3, batarang)
 
-        # Load and scale the hero images
-        self.original_image: pygame.Surface = pygame.image.load(
-            "sprites/batman_idle.png"
-        )
-        self.batman_down1: pygame.Surface = pygame.image.load(
-            "sprites/batman_walking_down1.png"
-        )
-        self.batman_down2: pygame.Surface = pygame.image.load(
-            "sprites/batman_walking_down2.png"
-        )
-        self.batman_up1: pygame.Surface = pygame.image.load(
-            "sprites/batman_walking_up1.png"
-        )
-        self.batman_up2: pygame.Surface = pygame.image.load(
-            "sprites/batman_walking_up2.png"
-        )
-        self.batman_left1: pygame.Surface = pygame.image.load(
-            "sprites/batman_walking_left1.png"
-        )
-        self.batman_left2: pygame.Surface = pygame.image.load(
-            "sprites/batman_walking_left2.png"
-        )
-        self.batman_right1: pygame.Surface = pygame.image.load(
-            "sprites/batman_walking_right1.png"
-        )
-        self.batman_right2: pygame.Surface = pygame.image.load(
-            "sprites/batman_walking_right2.png"
-        )
-
-        # Scale all images
-        scaled_size: Tuple[int, int] = (
-            int(self.original_image.get_width() * SPRITE_SCALE),
-            int(self.original_image.get_height() * SPRITE_SCALE),
-        )
-
-        self.image: pygame.Surface = pygame.transform.scale(
-            self.original_image, scaled_size
-        )
-        self.batman_idle_scaled: pygame.Surface = pygame.transform.scale(
-            self.original_image, scaled_size
-        )
-        self.batman_down1_scaled: pygame.Surface = pygame.transform.scale(
-            self.batman_down1, scaled_size
-        )
-        self.batman_down2_scaled: pygame.Surface = pygame.transform.scale(
-            self.batman_down2, scaled_size
-        )
-        self.batman_up1_scaled: pygame.Surface = pygame.transform.scale(
-            self.batman_up1, scaled_size
-        )
-        self.batman_up2_scaled: pygame.Surface = pygame.transform.scale(
-            self.batman_up2, scaled_size
-        )
-        self.batman_left1_scaled: pygame.Surface = pygame.transform.scale(
-            self.batman_left1, scaled_size
-        )
-        self.batman_left2_scaled: pygame.Surface = pygame.transform.scale(
-            self.batman_left2, scaled_size
-        )
-        self.batman_right1_scaled: pygame.Surface = pygame.transform.scale(
-            self.batman_right1, scaled_size
-        )
-        self.batman_right2_scaled: pygame.Surface = pygame.transform.scale(
-            self.batman_right2, scaled_size
-        )
+        # Shared hero clips; frames are loaded and scaled once per process by the asset registry
+        self.clips: Dict[str, int] = {
+            name: clips.define(
+                f"player_{name}",
+                [assets.get_scaled(sprite, SPRITE_SCALE) for sprite in sprites],
+                durations,
+            )
+            for name, (sprites, durations) in PLAYER_CLIPS.items()
+        }
+        self.image: pygame.Surface = clips[self.clips["idle"]].frames[0]
 
         self.rect: pygame.Rect = self.image.get_rect()
         self.health: int = 100
         self.age: int = 0
 
-        # Animation variables
+        # Animation state: the playing clip and a cursor into it
+        self.clip: int = self.clips["idle"]
         self.animation_frame: int = 0
-        self.animation_speed: int = 0
-        self.is_walking_down: bool = False
-        self.is_walking_up: bool = False
-        self.is_walking_left: bool = False
-        self.is_walking_right: bool = False
-
-    def handle_weapons(self, display: pygame.Surface):
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-
-        rel_x, rel_y = mouse_x - self.rect.centerx, mouse_y - self.rect.centery
+        self.animation_ticks: int = 0
+        self.direction: Tuple[int, int] = (0, 0)  # Direction actually moved last tick
+        self.subpixel: Tuple[float, float] = (0.0, 0.0)  # Movement not yet applied to the integer rect
+
+        # Position at the start of the last simulation tick, for render interpolation
+        self.previous_position: Tuple[int, int] = self.rect.topleft
+        # Mouse position the weapon points at, taken from the last input
+        self.aim: Tuple[int, int] = (0, 0)
+
+    def render_rect(self, alpha: float = 1.0) -> pygame.Rect:
+        """Get the rect to draw at, interpolated between the last two simulation ticks"""
+        previous_x, previous_y = self.previous_position
+        return self.rect.move(
+            round((previous_x - self.rect.x) * (1.0 - alpha)),
+            round((previous_y - self.rect.y) * (1.0 - alpha)),
+        )
+
+    def weapon_sprite(self, alpha: float = 1.0, offset: Tuple[int, int] = (0, 0)) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Get the weapon, turned towards the aim point, and its screen position"""
+        mouse_x, mouse_y = self.aim
+        rect = self.render_rect(alpha)
+        offset_x, offset_y = offset
+
+        rel_x, rel_y = mouse_x - rect.centerx, mouse_y - rect.centery
         angle = (180 / math.pi) * -math.atan2(rel_y, rel_x) + 225
 
-        player_weapon_copy = pygame.transform.rotate(self.weapon.img, angle)
-
-        display.blit(
+        player_weapon_copy = rotations.get(self.weapon.img, angle)
+        return (
             player_weapon_copy,
             (
-                self.rect.centerx + 30 - int(player_weapon_copy.get_width() / 2),
-                self.rect.centery + 40 - int(player_weapon_copy.get_height() / 2),
+                rect.centerx + 30 - int(player_weapon_copy.get_width() / 2) - offset_x,
+                rect.centery + 40 - int(player_weapon_copy.get_height() / 2) - offset_y,
             ),
         )
 
-    def update(self) -> None:
-        pressed_keys: pygame.key.ScancodeWrapper = pygame.key.get_pressed()
-
-        # Use fixed fullscreen dimensions since game only runs in fullscreen
-        current_width: int = SCREEN_WIDTH
-        current_height: int = SCREEN_HEIGHT
-
-        # Reset walking flags
-        self.is_walking_down = False
-        self.is_walking_up = False
-        self.is_walking_left = False
-        self.is_walking_right = False
-
-        if self.rect.left > 0:
-            if pressed_keys[pygame.K_a]:
-                self.rect.move_ip(-5, 0)
-                self.is_walking_left = True
-        if self.rect.right < current_width:
-            if pressed_keys[pygame.K_d]:
-                self.rect.move_ip(5, 0)
-                self.is_walking_right = True
-        if self.rect.top > 0:
-            if pressed_keys[pygame.K_w]:
-                self.rect.move_ip(0, -5)
-                self.is_walking_up = True
-        if (self.rect.bottom) < current_height:
-            if pressed_keys[pygame.K_s]:
-                self.rect.move_ip(0, 5)
-                self.is_walking_down = True
-
-        # Update animation
+    def update(self, inputs: Optional[InputState] = None) -> None:
+        self.previous_position = self.rect.topleft
+        if inputs is None:
+            inputs = InputState.from_devices()
+        self.aim = inputs.mouse_pos
+
+        (step_x, step_y), _ = MOVES[(inputs.right - inputs.left, inputs.down - inputs.up)]
+        step_x += self.subpixel[0]
+        step_y += self.subpixel[1]
+        # Move by whole pixels, truncating towards zero, and keep the rest for the next tick
+        self.rect.move_ip(int(step_x), int(step_y))
+        self.subpixel = (step_x - int(step_x), step_y - int(step_y))
+        self.rect.clamp_ip(PLAY_AREA)
+
+        # Animate by the movement that actually happened, so pushing into a wall shows idle
+        previous_x, previous_y = self.previous_position
+        self.direction = (_sign(self.rect.x - previous_x), _sign(self.rect.y - previous_y))
+        self.play(self.clips[MOVES[self.direction][1]])
         self._update_animation()
 
+    def play(self, clip_id: int) -> None:
+        """Switch to a clip, restarting it from its first frame (no-op if already playing)"""
+        if clip_id == self.clip:
+            return
+        self.clip = clip_id
+        self.animation_frame = 0
+        self.animation_ticks = 0
+        self.image = clips[clip_id].frames[0]
+
     def _update_animation(self) -> None:
-        """Update the walking animation when moving in any direction"""
-        if self.is_walking_down:
-            self.animation_speed += 1
-            # Change frame every 8 updates (adjust this value to control animation speed)
-            if self.animation_speed >= 8:
-                self.animation_frame = (self.animation_frame + 1) % 2
-                self.animation_speed = 0
-
-                # Update the image based on current frame
-                if self.animation_frame == 0:
-                    self.image = self.batman_down1_scaled
-                else:
-                    self.image = self.batman_down2_scaled
-        elif self.is_walking_up:
-            # Use the walking up sprite animation
-            self.animation_speed += 1
-            # Change frame every 8 updates (adjust this value to control animation speed)
-            if self.animation_speed >= 8:
-                self.animation_frame = (self.animation_frame + 1) % 2
-                self.animation_speed = 0
-
-                # Update the image based on current frame
-                if self.animation_frame == 0:
-                    self.image = self.batman_up1_scaled
-                else:
-                    self.image = self.batman_up2_scaled
-        elif self.is_walking_left:
-            # Use the walking left sprite animation
-            self.animation_speed += 1
-            # Change frame every 8 updates (adjust this value to control animation speed)
-            if self.animation_speed >= 8:
-                self.animation_frame = (self.animation_frame + 1) % 2
-                self.animation_speed = 0
-
-                # Update the image based on current frame
-                if self.animation_frame == 0:
-                    self.image = self.batman_left1_scaled
-                else:
-                    self.image = self.batman_left2_scaled
-        elif self.is_walking_right:
-            # Use the walking right sprite animation
-            self.animation_speed += 1
-            # Change frame every 8 updates (adjust this value to control animation speed)
-            if self.animation_speed >= 8:
-                self.animation_frame = (self.animation_frame + 1) % 2
-                self.animation_speed = 0
-
-                # Update the image based on current frame
-                if self.animation_frame == 0:
-                    self.image = self.batman_right1_scaled
-                else:
-                    self.image = self.batman_right2_scaled
-        else:
-            # Reset to default image when not walking
-            self.image = self.batman_idle_scaled
-            self.animation_frame = 0
-            self.animation_speed = 0
-
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.blit(self.image, self.rect)
+        """Advance the playing clip by one tick"""
+        clip = clips[self.clip]
+        self.animation_ticks += 1
+        if self.animation_ticks >= clip.durations[self.animation_frame]:
+            self.animation_ticks = 0
+            self.animation_frame = (self.animation_frame + 1) % len(clip)
+            self.image = clip.frames[self.animation_frame]
+
+    def sprites(self, alpha: float = 1.0, offset: Tuple[int, int] = (0, 0)) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Get the weapon and the player at their screen positions, back to front"""
+        rect = self.render_rect(alpha)
+        return [self.weapon_sprite(alpha, offset), (self.image, (rect.x - offset[0], rect.y - offset[1]))]
@@ -0,0 +1,158 @@
+import csv
+import json
+import time
+import numpy as np
+import pygame
+from typing import Dict, List, Optional, Tuple
+
+from config import HUD_HEIGHT, PROFILER_HISTORY, WHITE
+
+# Frame phases in the order they run; time between two marks goes to the later phase
+PHASES: Tuple[str, ...] = (
+    "events",
+    "player_update",
+    "pathfinding",
+    "enemy_move",
+    "projectile_update",
+    "collision",
+    "clear",
+    "player_draw",
+    "enemy_draw",
+    "projectile_draw",
+    "sprite_blit",
+    "hud",
+    "present",
+)
+
+OVERLAY_REFRESH_FRAMES: int = 15  # Re-render the overlay text every this many frames
+
+
+class FrameProfiler:
+    """Per-phase frame timings kept in a fixed-size ring buffer.
+
+    The game calls ``mark(phase)`` after each phase; the time since the
+    previous mark is added to that phase for the current frame. While
+    disabled every call returns immediately, so instrumentation can stay in
+    the loop permanently.
+    """
+
+    def __init__(self, phases: Tuple[str, ...] = PHASES, capacity: int = PROFILER_HISTORY, enabled: bool = False) -> None:
+        self.phases: Tuple[str, ...] = phases
+        self.enabled: bool = enabled
+        self.capacity: int = capacity
+        self._phase_index: Dict[str, int] = {name: i for i, name in enumerate(phases)}
+        self.samples: np.ndarray = np.zeros((capacity, len(phases)), dtype=np.float64)  # Milliseconds
+        self.frames_recorded: int = 0
+        self._current: np.ndarray = np.zeros(len(phases), dtype=np.float64)
+        self._last_mark: float = 0.0
+
+        self._overlay: Optional[pygame.Surface] = None
+        self._overlay_age: int = 0
+        self._font: Optional[pygame.font.Font] = None
+
+    def toggle(self) -> None:
+        """Switch recording and the overlay on or off"""
+        self.enabled = not self.enabled
+        self._overlay = None
+        # Start timing mid-frame without charging the time since the last mark
+        self._current[:] = 0.0
+        self._last_mark = time.perf_counter()
+
+    def begin_frame(self) -> None:
+        """Start timing a new frame"""
+        if not self.enabled:
+            return
+        self._current[:] = 0.0
+        self._last_mark = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """Charge the time since the previous mark to a phase"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._current[self._phase_index[phase]] += (now - self._last_mark) * 1000.0
+        self._last_mark = now
+
+    def end_frame(self) -> None:
+        """Store the finished frame in the ring buffer"""
+        if not self.enabled:
+            return
+        self.samples[self.frames_recorded % self.capacity] = self._current
+        self.frames_recorded += 1
+
+    def history(self) -> np.ndarray:
+        """Get the recorded frames, oldest first"""
+        if self.frames_recorded <= self.capacity:
+            return self.samples[:self.frames_recorded].copy()
+        start = self.frames_recorded % self.capacity
+        return np.concatenate((self.samples[start:], self.samples[:start]))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Get the rolling mean, p95 and p99 of every phase and of the whole frame"""
+        history = self.history()
+        if len(history) == 0:
+            return {}
+        columns = {name: history[:, i] for i, name in enumerate(self.phases)}
+        columns["frame"] = history.sum(axis=1)
+        return {
+            name: {
+                "mean": float(values.mean()),
+                "p95": float(np.percentile(values, 95)),
+                "p99": float(np.percentile(values, 99)),
+            }
+            for name, values in columns.items()
+        }
+
+    def draw_overlay(
+        self, surface: pygame.Surface, position: Tuple[int, int] = (10, HUD_HEIGHT + 10)
+    ) -> Optional[pygame.Rect]:
+        """Draw the timing table below the HUD, returning the region drawn (None while disabled)"""
+        if not self.enabled or self.frames_recorded == 0:
+            return None
+        if self._overlay is None or self._overlay_age >= OVERLAY_REFRESH_FRAMES:
+            self._overlay = self._render_overlay()
+            self._overlay_age = 0
+        self._overlay_age += 1
+        return surface.blit(self._overlay, position)
+
+    def export(self, path: str) -> None:
+        """Write the recorded history to a .csv or .json file"""
+        history = self.history()
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as export_file:
+                writer = csv.writer(export_file)
+                writer.writerow(["frame", *self.phases])
+                for i, row in enumerate(history.tolist()):
+                    writer.writerow([i, *row])
+        else:
+            with open(path, "w") as export_file:
+                json.dump(
+                    {
+                        "phases": list(self.phases),
+                        "unit": "ms",
+                        "summary": self.summary(),
+                        "frames": history.tolist(),
+                    },
+                    export_file,
+                )
+
+    def _render_overlay(self) -> pygame.Surface:
+        if self._font is None:
+            # Monospace keeps the columns aligned
+            self._font = pygame.font.SysFont("couriernew,dejavusansmono,monospace", 16)
+        lines: List[str] = [f"{'phase':<18}{'avg':>7}{'p95':>7}{'p99':>7}"]
+        for name, stats in self.summary().items():
+            lines.append(f"{name:<18}{stats['mean']:>7.2f}{stats['p95']:>7.2f}{stats['p99']:>7.2f}")
+
+        line_height = self._font.get_linesize()
+        rendered = [self._font.render(line, True, WHITE) for line in lines]
+        width = max(text.get_width() for text in rendered) + 12
+        overlay = pygame.Surface((width, line_height * len(rendered) + 12), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        for i, text in enumerate(rendered):
+            overlay.blit(text, (6, 6 + i * line_height))
+        return overlay
+
+
+# Shared profiler instrumenting the gameplay loop
+profiler: FrameProfiler = FrameProfiler()
@@ -0,0 +1,154 @@
+import math
+import numpy as np
+import pygame
+from typing import List, Optional, Set, Tuple
+
+from config import PROJECTILE_POOL_CAPACITY, PROJECTILE_SPEED, WORLD_HEIGHT, WORLD_WIDTH
+from enemy import Enemy
+from rotation_cache import rotations
+from swarm import EnemySwarm
+
+# Projectiles are drawn offset from their position, matching where the player holds the weapon
+DRAW_OFFSET_X: int = 30
+DRAW_OFFSET_Y: int = 40
+SPIN_PER_STEP: int = 30  # Degrees added to the spin every step
+
+
+class ProjectilePool:
+    """Preallocated, array-backed projectiles integrated and culled in one batched step.
+
+    Positions, velocities, spin and alive flags live in fixed-size arrays and
+    slots are recycled through a free list, so firing never allocates. When
+    every slot is in use new shots are dropped.
+    """
+
+    def __init__(self, image: pygame.Surface, capacity: int = PROJECTILE_POOL_CAPACITY, speed: float = PROJECTILE_SPEED) -> None:
+        self.image: pygame.Surface = image
+        self.capacity: int = capacity
+        self.speed: float = speed
+        self.half_width: int = image.get_width() // 2
+        self.half_height: int = image.get_height() // 2
+
+        self.x: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self.y: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self.vel_x: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self.vel_y: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self.heading: np.ndarray = np.zeros(capacity, dtype=np.float64)  # Degrees the sprite points along
+        self.spin: np.ndarray = np.zeros(capacity, dtype=np.int64)
+        self.alive: np.ndarray = np.zeros(capacity, dtype=np.bool_)
+
+        # Free slots, popped from the end so recently released slots are reused first
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+        self.dropped: int = 0
+
+    def __len__(self) -> int:
+        return self.capacity - len(self._free)
+
+    def fire(self, x: float, y: float, target_x: float, target_y: float) -> bool:
+        """Launch a projectile from (x, y) towards a target point"""
+        if not self._free:
+            self.dropped += 1
+            return False
+
+        i = self._free.pop()
+        angle = math.atan2(target_y - y, target_x - x)
+        self.x[i] = x
+        self.y[i] = y
+        self.vel_x[i] = math.cos(angle) * self.speed
+        self.vel_y[i] = math.sin(angle) * self.speed
+        # Add 90 degrees to make the batarang point in the right direction
+        self.heading[i] = math.degrees(angle) + 90
+        self.spin[i] = 0
+        self.alive[i] = True
+        return True
+
+    def step(self) -> None:
+        """Move and spin every live projectile, then release the ones that left the world"""
+        alive = self.alive
+        self.x[alive] += self.vel_x[alive]
+        self.y[alive] += self.vel_y[alive]
+        self.spin[alive] = (self.spin[alive] + SPIN_PER_STEP) % 360
+
+        outside = alive & (
+            (self.x < 0) | (self.x > WORLD_WIDTH) | (self.y < 0) | (self.y > WORLD_HEIGHT)
+        )
+        for i in np.flatnonzero(outside).tolist():
+            self.release(i)
+
+    def release(self, index: int) -> None:
+        """Return a slot to the pool"""
+        if self.alive[index]:
+            self.alive[index] = False
+            self._free.append(index)
+
+    def clear(self) -> None:
+        """Release every projectile"""
+        for i in np.flatnonzero(self.alive).tolist():
+            self.release(i)
+
+    def hit_test(self, swarm: EnemySwarm, damage: int) -> List[Enemy]:
+        """Damage the first enemy each projectile overlaps and release that projectile
+
+        All live projectiles are tested against the swarm's spatial hash in one
+        batched query. Returns each enemy whose health dropped to zero once;
+        projectiles reaching it later in the same tick pass through.
+        """
+        defeated: List[Enemy] = []
+        indices = np.flatnonzero(self.alive)
+        if len(indices) == 0 or len(swarm) == 0:
+            return defeated
+
+        center_x = self.x[indices].astype(np.int64) + DRAW_OFFSET_X
+        center_y = self.y[indices].astype(np.int64) + DRAW_OFFSET_Y
+        hits = swarm.first_colliding(
+            center_x - self.half_width,
+            center_y - self.half_height,
+            center_x + self.half_width,
+            center_y + self.half_height,
+        )
+
+        hit = hits >= 0
+        defeated_indices: Set[int] = set()
+        for projectile, enemy_index in zip(indices[hit].tolist(), hits[hit].tolist()):
+            # An enemy defeated earlier this tick is already gone; later projectiles fly on
+            if enemy_index in defeated_indices:
+                continue
+            enemy = swarm.views[enemy_index]
+            enemy.health -= damage
+            if enemy.health <= 0:
+                defeated_indices.add(enemy_index)
+                defeated.append(enemy)
+            self.release(projectile)
+        return defeated
+
+    def sprites(self, alpha: float = 1.0, view: Optional[pygame.Rect] = None) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Get every live projectile inside the view, at its current spin, with its top left corner
+
+        Motion is linear, so the position between the last two ticks is
+        recovered from the velocity without storing previous positions.
+        ``view`` is the world region on screen; projectiles outside it are
+        skipped and the rest are shifted to screen coordinates.
+        """
+        indices = np.flatnonzero(self.alive)
+        lag = 1.0 - alpha
+        xs = (self.x[indices] - self.vel_x[indices] * lag).astype(np.int64) + DRAW_OFFSET_X
+        ys = (self.y[indices] - self.vel_y[indices] * lag).astype(np.int64) + DRAW_OFFSET_Y
+        if view is not None:
+            # A spinning sprite never reaches further than its diagonal from the center
+            reach = self.half_width + self.half_height
+            visible = (
+                (xs > view.left - reach) & (xs < view.right + reach)
+                & (ys > view.top - reach) & (ys < view.bottom + reach)
+            )
+            indices = indices[visible]
+            xs = xs[visible] - view.left
+            ys = ys[visible] - view.top
+        xs = xs.tolist()
+        ys = ys.tolist()
+        angles = (self.heading[indices] + self.spin[indices]).tolist()
+        sprites = []
+        for x, y, angle in zip(xs, ys, angles):
+            rotated_image = rotations.get(self.image, angle)
+            width, height = rotated_image.get_size()
+            sprites.append((rotated_image, (x - width // 2, y - height // 2)))  # Centered on (x, y)
+        return sprites
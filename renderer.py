@@ -0,0 +1,125 @@
+import pygame
+from operator import itemgetter
+from typing import Callable, List, Optional, Tuple
+
+from config import DIRTY_RECT_FULL_REDRAW_RATIO
+
+# Paints the background of a screen rect for a view scrolled to the given world position
+BackgroundPainter = Callable[[pygame.Surface, pygame.Rect, Tuple[int, int]], None]
+
+# A sprite ready to blit: its image and the screen position of its top left corner
+Sprite = Tuple[pygame.Surface, Tuple[int, int]]
+
+# Draw layers, bottom to top; within a layer sprites are ordered by depth (their bottom edge)
+LAYER_ACTORS: int = 0
+LAYER_PROJECTILES: int = 1
+
+_draw_order = itemgetter(0, 1)
+
+
+class DirtyRectRenderer:
+    """Clears and presents only the screen regions touched this frame or the last.
+
+    Entities ``queue`` their sprites and anything drawn directly on the
+    display is reported with ``mark``. Queued sprites are sorted by layer and depth and
+    sent to the display in a single ``Surface.blits`` call by ``flush``. Each
+    frame the previous frame's rects are restored to the background, and only
+    the union of old and new rects is sent to the display. When the dirty area
+    grows past ``full_redraw_ratio`` of the screen the renderer falls back to a
+    full clear and a full present, which is cheaper than many large rects.
+
+    The background is a flat color unless a ``painter`` is given (e.g. a
+    tilemap). A scrolled background changes everywhere, so a frame whose
+    scroll differs from the last one is always redrawn in full.
+    """
+
+    def __init__(
+        self,
+        display: pygame.Surface,
+        background: Tuple[int, int, int],
+        full_redraw_ratio: float = DIRTY_RECT_FULL_REDRAW_RATIO,
+        painter: Optional[BackgroundPainter] = None,
+    ) -> None:
+        self.display: pygame.Surface = display
+        self.background: Tuple[int, int, int] = background
+        self.painter: Optional[BackgroundPainter] = painter
+        self.scroll: Tuple[int, int] = (0, 0)
+        self.full_redraw_ratio: float = full_redraw_ratio
+        self.screen_rect: pygame.Rect = display.get_rect()
+        self.screen_area: int = self.screen_rect.width * self.screen_rect.height
+
+        self._queue: List[Tuple[int, int, pygame.Surface, Tuple[int, int]]] = []
+        self._previous: List[pygame.Rect] = []
+        self._current: List[pygame.Rect] = []
+        self._full_redraw: bool = True  # First frame always paints everything
+
+        # Statistics for the last presented frame
+        self.last_dirty_count: int = 0
+        self.last_dirty_area: int = 0
+        self.last_was_full: bool = True
+
+    def invalidate(self) -> None:
+        """Force a full clear and present on the next frame (e.g. after a menu drew over the game)"""
+        self._full_redraw = True
+
+    def begin_frame(self, scroll: Tuple[int, int] = (0, 0)) -> None:
+        """Restore the background under everything drawn in the previous frame"""
+        if scroll != self.scroll:
+            self.scroll = scroll
+            self._full_redraw = True
+        if not self._full_redraw and self._area(self._previous) > self.screen_area * self.full_redraw_ratio:
+            self._full_redraw = True
+
+        if self._full_redraw:
+            self._paint(self.screen_rect)
+        else:
+            for rect in self._previous:
+                self._paint(rect)
+        self._current = []
+
+    def queue(self, sprites: List[Sprite], layer: int = LAYER_ACTORS, depth: int = 0) -> None:
+        """Add sprites to be drawn at the next ``flush``; later sprites cover earlier ones at equal depth"""
+        self._queue.extend([(layer, depth, source, dest) for source, dest in sprites])
+
+    def flush(self) -> None:
+        """Blit every queued sprite, back to front, in one call and remember the touched regions"""
+        if not self._queue:
+            return
+        # The sort is stable, so a weapon queued after its holder at the same depth stays on top
+        self._queue.sort(key=_draw_order)
+        # The clipped rects blits returns are exactly the dirty rects, cheaper than rebuilding them here
+        self._current += self.display.blits([(source, dest) for _, _, source, dest in self._queue])
+        self._queue = []
+
+    def mark(self, rect: pygame.Rect) -> None:
+        """Record a region drawn directly onto the display"""
+        self._current.append(rect.clip(self.screen_rect))
+
+    def present(self) -> None:
+        """Push only the changed regions to the screen, or everything when it is cheaper"""
+        self.flush()
+        dirty = self._previous + self._current
+        dirty_area = self._area(dirty)
+
+        if self._full_redraw or dirty_area > self.screen_area * self.full_redraw_ratio:
+            pygame.display.update()
+            self.last_was_full = True
+        else:
+            pygame.display.update(dirty)
+            self.last_was_full = False
+
+        self.last_dirty_count = len(dirty)
+        self.last_dirty_area = dirty_area
+        self._previous = self._current
+        self._current = []
+        self._full_redraw = False
+
+    def _paint(self, rect: pygame.Rect) -> None:
+        if self.painter is not None:
+            self.painter(self.display, rect, self.scroll)
+        else:
+            self.display.fill(self.background, rect)
+
+    @staticmethod
+    def _area(rects: List[pygame.Rect]) -> int:
+        return sum(rect.width * rect.height for rect in rects)
@@ -0,0 +1,223 @@
+"""Deterministic session recording and max-speed headless replay.
+
+Every gameplay session records the world seed and the input of every
+simulation tick into a compact binary log, closed by a fingerprint of the
+final world state. Replaying the log rebuilds the same world, feeds it the
+same inputs as fast as possible and checks the fingerprint, so a slow session
+can be reproduced and profiled on exactly the workload that caused it:
+
+    python replay.py last_session.rec
+    python replay.py last_session.rec --render --profile replay_profile.json
+"""
+import argparse
+import struct
+import sys
+import time
+import zlib
+import numpy as np
+from typing import List, NamedTuple, Optional
+
+from config import GAME_BG, RECORDING_PATH, TICK_RATE
+from controls import InputState
+
+MAGIC: bytes = b"TDNR"
+VERSION: int = 1
+
+# Log layout (little endian): header, one record per tick, end marker, final state
+HEADER = struct.Struct("<4sHHQ")  # magic, version, tick rate, world seed
+TICK = struct.Struct("<Bhhb")  # key flags, mouse x, mouse y, click count
+CLICK = struct.Struct("<hh")  # click position
+FINAL = struct.Struct("<IiiiiII")  # ticks, player x, player y, health, enemies, projectiles, enemy digest
+
+# Key flag bits; a flags byte of END_OF_TICKS closes the tick records
+KEY_LEFT: int = 1
+KEY_RIGHT: int = 2
+KEY_UP: int = 4
+KEY_DOWN: int = 8
+END_OF_TICKS: int = 0xFF
+
+
+class WorldState(NamedTuple):
+    """Fingerprint of a world used to check that a replay ended where the recording did"""
+
+    ticks: int
+    player_x: int
+    player_y: int
+    health: int
+    enemies: int
+    projectiles: int
+    enemy_digest: int  # CRC32 of every enemy's position and health
+
+
+def capture_state(world) -> WorldState:
+    """Fingerprint the simulation state of a world"""
+    swarm = world.enemy_swarm
+    n = swarm.count
+    health = np.array([enemy.health for enemy in swarm.views], dtype=np.int64)
+    digest = zlib.crc32(swarm.left[:n].tobytes())
+    digest = zlib.crc32(swarm.top[:n].tobytes(), digest)
+    digest = zlib.crc32(health.tobytes(), digest)
+    return WorldState(
+        world.tick,
+        world.player.rect.x,
+        world.player.rect.y,
+        world.player.health,
+        n,
+        len(world.projectile_pool),
+        digest,
+    )
+
+
+class InputRecorder:
+    """Appends the input of every simulation tick to an in-memory binary log"""
+
+    def __init__(self, seed: int, tick_rate: int = TICK_RATE) -> None:
+        self.seed: int = seed
+        self.ticks: int = 0
+        self._buffer: bytearray = bytearray(HEADER.pack(MAGIC, VERSION, tick_rate, seed))
+
+    def record(self, inputs: InputState) -> None:
+        """Store the input of one tick; call it with exactly what ``GameWorld.update`` receives"""
+        flags = (
+            (KEY_LEFT if inputs.left else 0)
+            | (KEY_RIGHT if inputs.right else 0)
+            | (KEY_UP if inputs.up else 0)
+            | (KEY_DOWN if inputs.down else 0)
+        )
+        clicks = inputs.clicks[:127]
+        self._buffer += TICK.pack(flags, inputs.mouse_pos[0], inputs.mouse_pos[1], len(clicks))
+        for x, y in clicks:
+            self._buffer += CLICK.pack(x, y)
+        self.ticks += 1
+
+    def to_bytes(self, world) -> bytes:
+        """Get the finished log, closed with the world's final state"""
+        return bytes(self._buffer) + bytes((END_OF_TICKS,)) + FINAL.pack(*capture_state(world))
+
+    def save(self, path: str, world) -> None:
+        """Write the finished log to a file"""
+        with open(path, "wb") as log_file:
+            log_file.write(self.to_bytes(world))
+
+
+class InputLog:
+    """A decoded recording: the world seed, the per-tick inputs and the expected final state"""
+
+    def __init__(self, seed: int, tick_rate: int, inputs: List[InputState], final: WorldState) -> None:
+        self.seed: int = seed
+        self.tick_rate: int = tick_rate
+        self.inputs: List[InputState] = inputs
+        self.final: WorldState = final
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "InputLog":
+        magic, version, tick_rate, seed = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a version %d session recording" % VERSION)
+
+        offset = HEADER.size
+        inputs: List[InputState] = []
+        while data[offset] != END_OF_TICKS:
+            flags, mouse_x, mouse_y, click_count = TICK.unpack_from(data, offset)
+            offset += TICK.size
+            clicks = tuple(CLICK.unpack_from(data, offset + i * CLICK.size) for i in range(click_count))
+            offset += click_count * CLICK.size
+            inputs.append(
+                InputState(
+                    bool(flags & KEY_LEFT),
+                    bool(flags & KEY_RIGHT),
+                    bool(flags & KEY_UP),
+                    bool(flags & KEY_DOWN),
+                    (mouse_x, mouse_y),
+                    clicks,
+                )
+            )
+        final = WorldState(*FINAL.unpack_from(data, offset + 1))
+        return cls(seed, tick_rate, inputs, final)
+
+    @classmethod
+    def load(cls, path: str) -> "InputLog":
+        with open(path, "rb") as log_file:
+            return cls.from_bytes(log_file.read())
+
+
+class ReplayResult:
+    """Outcome and timing of one replay"""
+
+    def __init__(self, final: WorldState, expected: WorldState, elapsed: float) -> None:
+        self.final: WorldState = final
+        self.expected: WorldState = expected
+        self.elapsed: float = elapsed
+
+    @property
+    def matches(self) -> bool:
+        return self.final == self.expected
+
+    @property
+    def ticks_per_sec(self) -> float:
+        return self.final.ticks / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+def replay(log: InputLog, render: bool = False) -> ReplayResult:
+    """Re-run a recording headless and as fast as possible, optionally drawing every tick.
+
+    Expects a display to exist (see ``headless.init_headless``).
+    """
+    # Imported here so the display exists before any sprite is converted
+    import pygame
+    from profiler import profiler
+    from renderer import DirtyRectRenderer
+    from world import GameWorld
+
+    world = GameWorld(seed=log.seed)
+    renderer = None
+    if render:
+        renderer = DirtyRectRenderer(pygame.display.get_surface(), GAME_BG, painter=world.background.paint)
+
+    start = time.perf_counter()
+    for inputs in log.inputs:
+        profiler.begin_frame()
+        world.update(inputs)
+        if renderer is not None:
+            renderer.begin_frame(world.camera.offset())
+            profiler.mark("clear")
+            world.draw(renderer)
+            renderer.present()
+            profiler.mark("present")
+        profiler.end_frame()
+    elapsed = time.perf_counter() - start
+
+    return ReplayResult(capture_state(world), log.final, elapsed)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a recorded session headless and verify it")
+    parser.add_argument("recording", nargs="?", default=RECORDING_PATH, help="session log to replay")
+    parser.add_argument("--render", action="store_true", help="draw every tick as well as simulating it")
+    parser.add_argument("--profile", help="record per-phase timings and export them to this .json/.csv file")
+    args = parser.parse_args(argv)
+
+    from headless import init_headless
+    from profiler import profiler
+
+    log = InputLog.load(args.recording)
+    init_headless()
+    if args.profile:
+        profiler.toggle()
+    result = replay(log, render=args.render)
+    if args.profile:
+        profiler.export(args.profile)
+
+    print(f"{len(log.inputs)} ticks in {result.elapsed:.3f}s ({result.ticks_per_sec:.0f} ticks/s)")
+    if not result.matches:
+        print("Replay diverged from the recording:")
+        for field, expected, actual in zip(WorldState._fields, result.expected, result.final):
+            if expected != actual:
+                print(f"  {field}: recorded {expected}, replayed {actual}")
+        return 1
+    print("Final state matches the recording")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
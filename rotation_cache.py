@@ -0,0 +1,86 @@
+import pygame
+from collections import OrderedDict
+from typing import Tuple
+
+from config import ROTATION_CACHE_BYTES, ROTATION_STEPS
+
+
+class RotationCache:
+    """Shares pre-rotated copies of sprites, quantized to a fixed angular resolution.
+
+    Entries are keyed by the source Surface itself, so every projectile and
+    weapon using the same shared sprite hits the same rotations. The least
+    recently used rotations are evicted once the memory bound is exceeded.
+    """
+
+    def __init__(self, steps: int = ROTATION_STEPS, max_bytes: int = ROTATION_CACHE_BYTES) -> None:
+        self.steps: int = max(1, steps)
+        self.step_degrees: float = 360.0 / self.steps
+        self.max_bytes: int = max_bytes
+        self._rotations: "OrderedDict[Tuple[pygame.Surface, int], pygame.Surface]" = OrderedDict()
+        self.bytes_used: int = 0
+
+        # Cache statistics
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def quantize(self, angle: float) -> int:
+        """Get the step index closest to an angle in degrees"""
+        return int(round(angle / self.step_degrees)) % self.steps
+
+    def get(self, surface: pygame.Surface, angle: float) -> pygame.Surface:
+        """Get the surface rotated to the nearest cached angle"""
+        key = (surface, self.quantize(angle))
+        rotated = self._rotations.get(key)
+        if rotated is not None:
+            self.hits += 1
+            self._rotations.move_to_end(key)
+            return rotated
+
+        self.misses += 1
+        return self._render(key)
+
+    def prewarm(self, surface: pygame.Surface) -> None:
+        """Render every step of a sprite ahead of time"""
+        for step in range(self.steps):
+            key = (surface, step)
+            if key not in self._rotations:
+                self._render(key)
+
+    def stats(self) -> dict:
+        """Get hit/miss counters and memory usage"""
+        return {
+            "entries": len(self._rotations),
+            "bytes_used": self.bytes_used,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached rotation"""
+        self._rotations.clear()
+        self.bytes_used = 0
+
+    def _render(self, key: Tuple[pygame.Surface, int]) -> pygame.Surface:
+        surface, step = key
+        rotated = pygame.transform.rotate(surface, step * self.step_degrees)
+        self._rotations[key] = rotated
+        self.bytes_used += self._size_of(rotated)
+
+        # Evict least recently used rotations until we are back under budget
+        while self.bytes_used > self.max_bytes and len(self._rotations) > 1:
+            _, evicted = self._rotations.popitem(last=False)
+            self.bytes_used -= self._size_of(evicted)
+            self.evictions += 1
+        return rotated
+
+    @staticmethod
+    def _size_of(surface: pygame.Surface) -> int:
+        width, height = surface.get_size()
+        return surface.get_bytesize() * width * height
+
+
+# Shared cache used by projectiles and the player's weapon
+rotations: RotationCache = RotationCache()
@@ -0,0 +1,78 @@
+import math
+from typing import Any, Callable, List, Tuple
+
+from config import TICK_RATE, TIMER_WHEEL_SLOTS
+
+
+def ms_to_ticks(milliseconds: float) -> int:
+    """Convert a duration in milliseconds to whole simulation ticks (at least one)"""
+    return max(1, math.ceil(milliseconds * TICK_RATE / 1000.0))
+
+
+class Timer:
+    """Handle for a scheduled callback; pass it to ``TimerWheel.cancel`` to drop it"""
+
+    __slots__ = ("due", "callback", "args", "cancelled")
+
+    def __init__(self, due: int, callback: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+        self.due: int = due
+        self.callback: Callable[..., Any] = callback
+        self.args: Tuple[Any, ...] = args
+        self.cancelled: bool = False
+
+
+class TimerWheel:
+    """Hashed timer wheel that runs delayed callbacks on simulation ticks.
+
+    Timers are bucketed by ``due % slots``; each ``advance`` visits a single
+    bucket, so scheduling, cancelling and expiring are O(1) for delays shorter
+    than the wheel. Longer delays simply stay in their bucket for extra
+    laps. Time only moves when the simulation ticks, so timers behave the same
+    headless, paused or fast-forwarded.
+    """
+
+    def __init__(self, slots: int = TIMER_WHEEL_SLOTS) -> None:
+        self.slot_count: int = slots
+        self._slots: List[List[Timer]] = [[] for _ in range(slots)]
+        self.tick: int = 0
+        self.pending: int = 0
+
+    def schedule(self, delay_ticks: int, callback: Callable[..., Any], *args: Any) -> Timer:
+        """Run ``callback(*args)`` after the given number of ticks (at least one)"""
+        timer = Timer(self.tick + max(1, delay_ticks), callback, args)
+        self._slots[timer.due % self.slot_count].append(timer)
+        self.pending += 1
+        return timer
+
+    def cancel(self, timer: Timer) -> None:
+        """Drop a scheduled timer; it is removed lazily when its bucket comes round"""
+        if not timer.cancelled:
+            timer.cancelled = True
+            self.pending -= 1
+
+    def advance(self) -> None:
+        """Move time forward one tick and run every timer that became due"""
+        self.tick += 1
+        index = self.tick % self.slot_count
+        bucket = self._slots[index]
+        if not bucket:
+            return
+
+        waiting: List[Timer] = []
+        # Callbacks may schedule new timers into this bucket while it is being walked
+        for timer in bucket:
+            if timer.cancelled:
+                continue
+            if timer.due <= self.tick:
+                timer.cancelled = True
+                self.pending -= 1
+                timer.callback(*timer.args)
+            else:
+                waiting.append(timer)
+        self._slots[index] = waiting
+
+    def clear(self) -> None:
+        """Drop every scheduled timer"""
+        for bucket in self._slots:
+            bucket.clear()
+        self.pending = 0
@@ -1,6 +1,20 @@
-from .home_screen import HomeScreen
-from .options_screen import OptionsScreen
-from .pause_menu import PauseMenu
-from .game_over_screen import GameOverScreen
+import importlib
 
-__all__ = ['HomeScreen', 'OptionsScreen', 'PauseMenu', 'GameOverScreen'] 
\ No newline at end of file
+# Screens are imported on first use, so loading one menu never imports the others
+_SCREEN_MODULES = {
+    'HomeScreen': 'home_screen',
+    'OptionsScreen': 'options_screen',
+    'PauseMenu': 'pause_menu',
+    'GameOverScreen': 'game_over_screen',
+    'LoadingScreen': 'loading_screen',
+}
+
+__all__ = ['HomeScreen', 'OptionsScreen', 'PauseMenu', 'GameOverScreen', 'LoadingScreen']
+
+
+def __getattr__(name: str):
+    if name not in _SCREEN_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    screen = getattr(importlib.import_module(f".{_SCREEN_MODULES[name]}", __name__), name)
+    globals()[name] = screen  # Later lookups skip __getattr__
+    return screen
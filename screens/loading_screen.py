@@ -0,0 +1,40 @@
+import pygame
+from assets import AssetRegistry, assets
+from text_cache import text_cache
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, DARK_GRAY, GOLD, FPS
+
+
+class LoadingScreen:
+    def __init__(self) -> None:
+        # Progress bar dimensions and position
+        self.bar_rect = pygame.Rect(SCREEN_WIDTH//2 - 200, SCREEN_HEIGHT//2, 400, 30)
+
+    def run(self, display_surface: pygame.Surface, clock: pygame.time.Clock, loader: AssetRegistry = assets) -> str:
+        """Show loading progress until the loader's background work is done"""
+        while loader.loading:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    return "quit"
+
+            # Convert whatever the loader threads finished since the last frame
+            loader.poll()
+
+            # Draw Batman-themed background
+            display_surface.fill(DARK_GRAY)
+
+            # Draw title
+            title_text = text_cache.render("LOADING", 72, GOLD)
+            title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4))
+            display_surface.blit(title_text, title_rect)
+
+            # Draw progress bar
+            pygame.draw.rect(display_surface, WHITE, self.bar_rect, 2)
+            fill_rect = self.bar_rect.inflate(-8, -8)
+            fill_rect.width = int(fill_rect.width * loader.progress)
+            if fill_rect.width > 0:
+                pygame.draw.rect(display_surface, GOLD, fill_rect)
+
+            pygame.display.update()
+            clock.tick(FPS)
+        return "done"
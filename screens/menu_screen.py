@@ -0,0 +1,105 @@
+import pygame
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional
+
+from assets import assets
+from ui_components.button import Button
+from config import MENU_WAKE_MS
+
+# Events after which the window contents may have been lost
+EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
+
+class MenuScreen(ABC):
+    """Base class for menus that sit idle until the player does something.
+
+    Everything except the buttons is rendered once into a cached background
+    layer. The menu then blocks in ``pygame.event.wait`` and, when a button's
+    hover state changes, repaints and presents only that button's rect, so an
+    idle menu uses next to no CPU. It still wakes every ``MENU_WAKE_MS`` for
+    ``on_idle`` (background asset loading).
+    """
+
+    def __init__(self, buttons: List[Button], actions: Dict[str, str]) -> None:
+        self.buttons: List[Button] = buttons
+        self.actions: Dict[str, str] = actions  # Button text -> action returned by run
+        self._layer: Optional[pygame.Surface] = None
+        self._layer_stale: bool = True
+
+    @abstractmethod
+    def draw_background(self, surface: pygame.Surface) -> None:
+        """Draw everything but the buttons; called once per cached layer"""
+        pass
+
+    def handle_event(self, event: pygame.event.Event) -> Optional[str]:
+        """Get the action an event triggers, if any"""
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            return "quit"
+        for button in self.buttons:
+            if button.handle_event(event):
+                return self.actions.get(button.text)
+        return None
+
+    def on_idle(self) -> None:
+        """Background work done whenever the menu wakes up"""
+        # Finish gameplay sprites decoded in the background while the menu is idle
+        assets.poll()
+
+    def layer(self, display_surface: pygame.Surface) -> pygame.Surface:
+        """Get the cached background layer, rendering it on first use"""
+        if self._layer is None or self._layer.get_size() != display_surface.get_size():
+            self._layer = pygame.Surface(display_surface.get_size()).convert(display_surface)
+            self._layer_stale = True
+        if self._layer_stale:
+            self.draw_background(self._layer)
+            self._layer_stale = False
+        return self._layer
+
+    def invalidate_layer(self) -> None:
+        """Re-render the layer (into the same Surface) the next time it is needed"""
+        self._layer_stale = True
+
+    def run(
+        self,
+        display_surface: pygame.Surface,
+        clock: pygame.time.Clock,
+        on_first_frame: Optional[Callable[[], None]] = None,
+    ) -> str:
+        self.present(display_surface)
+        if on_first_frame is not None:
+            on_first_frame()
+
+        while True:
+            event = pygame.event.wait(MENU_WAKE_MS)
+            events = [event, *pygame.event.get()] if event.type != pygame.NOEVENT else []
+            for event in events:
+                if event.type in EXPOSE_EVENTS:
+                    self.present(display_surface)
+                action = self.handle_event(event)
+                if action is not None:
+                    return action
+
+            self.on_idle()
+            self.present_changes(display_surface)
+
+    def present(self, display_surface: pygame.Surface) -> None:
+        """Draw and present the whole menu"""
+        display_surface.blit(self.layer(display_surface), (0, 0))
+        for button in self.buttons:
+            button.draw(display_surface)
+            button.dirty = False
+        pygame.display.update()
+
+    def present_changes(self, display_surface: pygame.Surface) -> None:
+        """Repaint and present only the buttons whose look changed"""
+        layer = self.layer(display_surface)
+        dirty_rects = []
+        for button in self.buttons:
+            if button.dirty:
+                display_surface.blit(layer, button.rect, button.rect)
+                button.draw(display_surface)
+                button.dirty = False
+                dirty_rects.append(button.rect)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
@@ -0,0 +1,152 @@
+import numpy as np
+import pygame
+
+from config import SPATIAL_HASH_CELL_SIZE
+
+# Cell coordinates are shifted so negative positions still produce positive keys
+_CELL_OFFSET: int = 1 << 20
+_CELL_STRIDE: int = 1 << 21
+
+
+class SpatialHash:
+    """Uniform grid over entity centers for near-constant-time neighbourhood queries.
+
+    The grid is rebuilt from position arrays with one sort: entity indices are
+    ordered by cell key, so every cell is a contiguous slice found with a
+    binary search. Queries only look at the cells they overlap and return the
+    indices of matching entities in ascending order.
+    """
+
+    def __init__(self, cell_size: int = SPATIAL_HASH_CELL_SIZE) -> None:
+        self.cell_size: int = cell_size
+        self.count: int = 0
+        self._left = np.zeros(0, dtype=np.int64)
+        self._top = np.zeros(0, dtype=np.int64)
+        self._right = np.zeros(0, dtype=np.int64)
+        self._bottom = np.zeros(0, dtype=np.int64)
+        self._center_x = np.zeros(0, dtype=np.int64)
+        self._center_y = np.zeros(0, dtype=np.int64)
+        self._order = np.zeros(0, dtype=np.int64)
+        self._sorted_keys = np.zeros(0, dtype=np.int64)
+        self._half_width: int = 0
+        self._half_height: int = 0
+
+    def rebuild(self, left: np.ndarray, top: np.ndarray, width: np.ndarray, height: np.ndarray) -> None:
+        """Index entities by the cell containing their center"""
+        self.count = len(left)
+        self._left = left.astype(np.int64)
+        self._top = top.astype(np.int64)
+        self._right = self._left + width
+        self._bottom = self._top + height
+        self._center_x = self._left + width // 2
+        self._center_y = self._top + height // 2
+        self._half_width = int(width.max()) // 2 + 1 if self.count else 0
+        self._half_height = int(height.max()) // 2 + 1 if self.count else 0
+
+        keys = self._keys(self._center_x // self.cell_size, self._center_y // self.cell_size)
+        self._order = np.argsort(keys, kind="stable")
+        self._sorted_keys = keys[self._order]
+
+    def query_rect(self, rect: pygame.Rect) -> np.ndarray:
+        """Get the indices of entities whose bounding box overlaps the rect"""
+        # Any overlapping entity has its center within half its size of the rect
+        candidates = self._candidates(
+            rect.left - self._half_width,
+            rect.top - self._half_height,
+            rect.right + self._half_width,
+            rect.bottom + self._half_height,
+        )
+        if len(candidates) == 0:
+            return candidates
+        overlapping = (
+            (self._left[candidates] < rect.right)
+            & (self._right[candidates] > rect.left)
+            & (self._top[candidates] < rect.bottom)
+            & (self._bottom[candidates] > rect.top)
+        )
+        return candidates[overlapping]
+
+    def query_radius(self, x: int, y: int, radius: float) -> np.ndarray:
+        """Get the indices of entities whose center is within radius of a point"""
+        candidates = self._candidates(x - radius, y - radius, x + radius, y + radius)
+        if len(candidates) == 0:
+            return candidates
+        distance_sq = (self._center_x[candidates] - x) ** 2 + (self._center_y[candidates] - y) ** 2
+        return candidates[distance_sq <= radius * radius]
+
+    def first_overlaps(self, left: np.ndarray, top: np.ndarray, right: np.ndarray, bottom: np.ndarray) -> np.ndarray:
+        """Batch query: for each box get the lowest index of an overlapping entity, or -1"""
+        queries = len(left)
+        first = np.full(queries, -1, dtype=np.int64)
+        if self.count == 0 or queries == 0:
+            return first
+
+        size = self.cell_size
+        query_ids = np.arange(queries)
+        cells_left = (left - self._half_width) // size
+        cells_top = (top - self._half_height) // size
+        cells_right = (right + self._half_width) // size
+        cells_bottom = (bottom + self._half_height) // size
+        span_x = int((cells_right - cells_left).max()) + 1
+        span_y = int((cells_bottom - cells_top).max()) + 1
+
+        pair_queries = []
+        pair_entities = []
+        for offset_y in range(span_y):
+            for offset_x in range(span_x):
+                cell_x = cells_left + offset_x
+                cell_y = cells_top + offset_y
+                inside = (cell_x <= cells_right) & (cell_y <= cells_bottom)
+                keys = self._keys(cell_x[inside], cell_y[inside])
+                starts = np.searchsorted(self._sorted_keys, keys, side="left")
+                counts = np.searchsorted(self._sorted_keys, keys, side="right") - starts
+                total = int(counts.sum())
+                if total == 0:
+                    continue
+                # Expand every (query, cell slice) into one row per stored entity
+                owners = np.repeat(query_ids[inside], counts)
+                slice_starts = np.repeat(starts - np.cumsum(counts) + counts, counts)
+                pair_queries.append(owners)
+                pair_entities.append(self._order[slice_starts + np.arange(total)])
+
+        if not pair_queries:
+            return first
+        owners = np.concatenate(pair_queries)
+        entities = np.concatenate(pair_entities)
+        overlapping = (
+            (self._left[entities] < right[owners])
+            & (self._right[entities] > left[owners])
+            & (self._top[entities] < bottom[owners])
+            & (self._bottom[entities] > top[owners])
+        )
+        owners = owners[overlapping]
+        entities = entities[overlapping]
+        if len(owners):
+            lowest = np.full(queries, np.iinfo(np.int64).max, dtype=np.int64)
+            np.minimum.at(lowest, owners, entities)
+            hit = lowest != np.iinfo(np.int64).max
+            first[hit] = lowest[hit]
+        return first
+
+    def _candidates(self, left: float, top: float, right: float, bottom: float) -> np.ndarray:
+        """Get the indices of every entity stored in cells overlapping a box"""
+        if self.count == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        size = self.cell_size
+        cells_x = np.arange(int(left) // size, int(right) // size + 1)
+        cells_y = np.arange(int(top) // size, int(bottom) // size + 1)
+        keys = self._keys(cells_x[np.newaxis, :], cells_y[:, np.newaxis]).ravel()
+
+        starts = np.searchsorted(self._sorted_keys, keys, side="left")
+        ends = np.searchsorted(self._sorted_keys, keys, side="right")
+        occupied = ends > starts
+        if not occupied.any():
+            return np.zeros(0, dtype=np.int64)
+
+        slices = [self._order[start:end] for start, end in zip(starts[occupied], ends[occupied])]
+        return np.sort(np.concatenate(slices))
+
+    @staticmethod
+    def _keys(cell_x: np.ndarray, cell_y: np.ndarray) -> np.ndarray:
+        return (cell_y + _CELL_OFFSET) * _CELL_STRIDE + (cell_x + _CELL_OFFSET)
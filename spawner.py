@@ -0,0 +1,95 @@
+from typing import Callable, List
+
+from config import (
+    ENEMY_POOL_CAPACITY,
+    FIRST_WAVE_SIZE,
+    SPAWNS_PER_TICK,
+    WAVE_DELAY_MS,
+    WAVE_SIZE_GROWTH,
+)
+from enemy import Enemy
+from scheduler import TimerWheel, ms_to_ticks
+
+
+class EnemyPool:
+    """Preallocated enemies handed out on spawn and taken back when they die.
+
+    All enemies are built up front, so steady-state play never constructs
+    sprites, Rects or animation state; they share the same clips and weapon,
+    so a pooled enemy costs nothing beyond its own bookkeeping. If the pool
+    runs dry it builds more, counted in ``allocated``.
+    """
+
+    def __init__(self, factory: Callable[[], Enemy], capacity: int = ENEMY_POOL_CAPACITY) -> None:
+        self._factory: Callable[[], Enemy] = factory
+        self._free: List[Enemy] = [factory() for _ in range(capacity)]
+        self.allocated: int = capacity
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(self) -> Enemy:
+        """Take an idle enemy (its state is stale until it is respawned)"""
+        if self._free:
+            return self._free.pop()
+        self.allocated += 1
+        return self._factory()
+
+    def release(self, enemy: Enemy) -> None:
+        """Return a dead enemy to the pool"""
+        self._free.append(enemy)
+
+
+class WaveSpawner:
+    """Escalating enemy waves, spawned a few enemies per tick.
+
+    Each wave queues ``first_wave_size + (wave - 1) * growth`` enemies (never
+    more than ``max_wave_size``) and at most ``spawns_per_tick`` of them enter
+    per tick, so big waves never cause a frame spike. Once a wave is fully
+    spawned and cleared, the next one starts ``wave_delay_ticks`` later on the
+    world's timer wheel.
+    """
+
+    def __init__(
+        self,
+        spawn: Callable[[int], Enemy],
+        scheduler: TimerWheel,
+        first_wave_size: int = FIRST_WAVE_SIZE,
+        growth: int = WAVE_SIZE_GROWTH,
+        spawns_per_tick: int = SPAWNS_PER_TICK,
+        wave_delay_ticks: int = ms_to_ticks(WAVE_DELAY_MS),
+        max_wave_size: int = ENEMY_POOL_CAPACITY,
+    ) -> None:
+        self._spawn: Callable[[int], Enemy] = spawn  # Called with the running spawn number
+        self.scheduler: TimerWheel = scheduler
+        self.first_wave_size: int = first_wave_size
+        self.growth: int = growth
+        self.spawns_per_tick: int = spawns_per_tick
+        self.wave_delay_ticks: int = wave_delay_ticks
+        self.max_wave_size: int = max_wave_size
+
+        self.wave: int = 0
+        self.queued: int = 0  # Enemies of the current wave still waiting to spawn
+        self.spawned: int = 0  # Enemies spawned over the whole game
+        self.waiting: bool = False  # Next wave is scheduled
+
+    def wave_size(self, wave: int) -> int:
+        """Get how many enemies a wave has"""
+        return min(self.first_wave_size + (wave - 1) * self.growth, self.max_wave_size)
+
+    def start_next_wave(self) -> None:
+        """Queue the enemies of the next wave"""
+        self.waiting = False
+        self.wave += 1
+        self.queued += self.wave_size(self.wave)
+
+    def update(self, alive: int) -> None:
+        """Spawn this tick's share of the queue, or schedule the next wave once ``alive`` hits zero"""
+        if self.queued:
+            for _ in range(min(self.queued, self.spawns_per_tick)):
+                self._spawn(self.spawned)
+                self.spawned += 1
+            self.queued -= min(self.queued, self.spawns_per_tick)
+        elif alive == 0 and not self.waiting:
+            self.waiting = True
+            self.scheduler.schedule(self.wave_delay_ticks, self.start_next_wave)
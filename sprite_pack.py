@@ -0,0 +1,237 @@
+"""Offline sprite baking: every sprite variant the game draws, packed into one atlas file.
+
+The pack holds each sprite at its original size plus the pre-scaled and
+mirrored variants listed in ``assets.PACKED_VARIANTS``, shelf-packed into a
+single RGBA image. The file is a small header, a JSON index of frame rects
+and the raw pixels, so loading it is one memory-mapped read into one Surface
+that the game slices with subsurfaces:
+
+    python sprite_pack.py            # rebuild sprites/sprites.pack if any PNG changed
+    python sprite_pack.py --force    # rebuild unconditionally
+
+The index records a content hash of the source PNGs; the game rebuilds a
+stale pack on startup, so the baked file never has to be committed.
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+import pygame
+from typing import Dict, List, Optional, Tuple
+
+from assets import ASSET_ROOT, PACKED_VARIANTS, SPRITE_PATHS, Variant
+from config import SPRITE_PACK_PATH, SPRITE_PACK_WIDTH
+
+MAGIC: bytes = b"TDNP"
+VERSION: int = 1
+
+# File layout (little endian): header, JSON index, zero padding, RGBA pixels
+HEADER = struct.Struct("<4sHHHI")  # magic, version, atlas width, atlas height, index length
+PIXEL_ALIGNMENT: int = 64  # Pixel data starts on a cache-line boundary
+PADDING: int = 1  # Transparent pixels between packed frames
+
+Rect = Tuple[int, int, int, int]
+
+
+def content_hash(paths: Dict[str, str], variants: List[Variant], root: str = ASSET_ROOT) -> str:
+    """Hash the bake inputs: pack version, sprite names, file contents and variant list"""
+    digest = hashlib.sha1(b"%d" % VERSION)
+    for name in sorted(paths):
+        digest.update(name.encode() + b"\0" + paths[name].encode() + b"\0")
+        with open(os.path.join(root, paths[name]), "rb") as image_file:
+            digest.update(image_file.read())
+    digest.update(repr(sorted(variants)).encode())
+    return digest.hexdigest()
+
+
+def file_stamps(paths: Dict[str, str], root: str = ASSET_ROOT) -> Dict[str, List[int]]:
+    """Get the size and modification time of every source file (no file is opened)"""
+    stamps = {}
+    for name, path in paths.items():
+        stat = os.stat(os.path.join(root, path))
+        stamps[name] = [stat.st_size, stat.st_mtime_ns]
+    return stamps
+
+
+class SpritePack:
+    """A loaded sprite pack: one atlas Surface and the rect of every frame in it"""
+
+    def __init__(self, surface: pygame.Surface, frames: Dict[Variant, Rect], mapped: Optional[mmap.mmap] = None) -> None:
+        self.surface: pygame.Surface = surface
+        self.frames: Dict[Variant, Rect] = frames
+        self._mapped: Optional[mmap.mmap] = mapped  # File mapping the atlas pixels still live in
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def subsurfaces(self) -> Dict[Variant, pygame.Surface]:
+        """Get a view into the atlas for every frame (no pixels are copied)"""
+        return {variant: self.surface.subsurface(rect) for variant, rect in self.frames.items()}
+
+    def converted(self) -> "SpritePack":
+        """Copy the atlas into the display's pixel format and release the file (main thread only)"""
+        surface = self.surface.convert_alpha()
+        self.close()
+        return SpritePack(surface, self.frames)
+
+    def close(self) -> None:
+        """Unmap the pack file; the atlas Surface is unusable afterwards unless it was converted"""
+        if self._mapped is not None:
+            self.surface = None
+            self._mapped.close()
+            self._mapped = None
+
+
+def read_index(path: str) -> Optional[dict]:
+    """Read just the header and index of a pack, or None if it is missing or from another version"""
+    try:
+        with open(path, "rb") as pack_file:
+            header = pack_file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                return None
+            magic, version, _, _, index_length = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                return None
+            return json.loads(pack_file.read(index_length))
+    except (OSError, ValueError):
+        return None
+
+
+def is_fresh(
+    path: str = SPRITE_PACK_PATH,
+    paths: Dict[str, str] = SPRITE_PATHS,
+    variants: List[Variant] = PACKED_VARIANTS,
+    root: str = ASSET_ROOT,
+) -> bool:
+    """Check whether a pack was baked from the current sprites.
+
+    Unchanged file sizes and modification times are trusted; otherwise the
+    files are hashed, so a checkout that only touched timestamps does not
+    force a rebuild.
+    """
+    index = read_index(_resolve(path, root))
+    if index is None or set(index["stamps"]) != set(paths):
+        return False
+    if index["stamps"] == file_stamps(paths, root) and index["variants"] == [list(v) for v in sorted(variants)]:
+        return True
+    return index["hash"] == content_hash(paths, variants, root)
+
+
+def bake(
+    path: str = SPRITE_PACK_PATH,
+    paths: Dict[str, str] = SPRITE_PATHS,
+    variants: List[Variant] = PACKED_VARIANTS,
+    root: str = ASSET_ROOT,
+    atlas_width: int = SPRITE_PACK_WIDTH,
+) -> int:
+    """Decode, scale, mirror and pack every sprite variant into a pack file; returns its size in bytes
+
+    Needs no display, so it can run offline or on a loader thread.
+    """
+    originals = {name: pygame.image.load(os.path.join(root, file_path)) for name, file_path in paths.items()}
+    images: Dict[Variant, pygame.Surface] = {(name, 1.0, False): image for name, image in originals.items()}
+    for name, scale, mirrored in variants:
+        image = originals[name]
+        if scale != 1.0:
+            image = pygame.transform.scale(image, (int(image.get_width() * scale), int(image.get_height() * scale)))
+        if mirrored:
+            image = pygame.transform.flip(image, True, False)
+        images[(name, scale, mirrored)] = image
+
+    # Shelf packing, tallest frames first: fill a row left to right, then start a new one below
+    frames: Dict[Variant, Rect] = {}
+    x = y = shelf_height = 0
+    for variant in sorted(images, key=lambda key: (-images[key].get_height(), key)):
+        width, height = images[variant].get_size()
+        if x + width > atlas_width:
+            x, y, shelf_height = 0, y + shelf_height + PADDING, 0
+        frames[variant] = (x, y, width, height)
+        x += width + PADDING
+        shelf_height = max(shelf_height, height)
+    atlas_height = y + shelf_height
+
+    atlas = pygame.Surface((atlas_width, atlas_height), pygame.SRCALPHA, 32)
+    for variant, (x, y, _, _) in frames.items():
+        # MAX onto the cleared atlas copies pixels exactly instead of alpha blending them
+        atlas.blit(images[variant], (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+
+    index = json.dumps(
+        {
+            "hash": content_hash(paths, variants, root),
+            "stamps": file_stamps(paths, root),
+            "variants": [list(variant) for variant in sorted(variants)],
+            "frames": [[name, scale, mirrored, *rect] for (name, scale, mirrored), rect in frames.items()],
+        }
+    ).encode()
+    header = HEADER.pack(MAGIC, VERSION, atlas_width, atlas_height, len(index))
+    padding = -(len(header) + len(index)) % PIXEL_ALIGNMENT
+    pixels = pygame.image.tobytes(atlas, "RGBA")
+
+    # Write next to the target and rename, so a half-written pack is never read
+    path = _resolve(path, root)
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as pack_file:
+        pack_file.write(header + index + bytes(padding) + pixels)
+    os.replace(temporary_path, path)
+    return len(header) + len(index) + padding + len(pixels)
+
+
+def load(path: str = SPRITE_PACK_PATH, root: str = ASSET_ROOT) -> SpritePack:
+    """Map a pack file into memory and wrap its pixels in one Surface without copying them
+
+    The atlas reads straight from the mapping in the file's RGBA layout; call
+    ``converted`` on the main thread once a display exists.
+    """
+    with open(_resolve(path, root), "rb") as pack_file:
+        mapped = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, width, height, index_length = HEADER.unpack_from(mapped, 0)
+    if magic != MAGIC or version != VERSION:
+        mapped.close()
+        raise ValueError(f"{path}: not a version {VERSION} sprite pack")
+    index = json.loads(mapped[HEADER.size:HEADER.size + index_length])
+    start = HEADER.size + index_length
+    start += -start % PIXEL_ALIGNMENT
+    surface = pygame.image.frombuffer(memoryview(mapped)[start:start + width * height * 4], (width, height), "RGBA")
+
+    frames = {(name, scale, mirrored): (x, y, w, h) for name, scale, mirrored, x, y, w, h in index["frames"]}
+    return SpritePack(surface, frames, mapped)
+
+
+def load_or_bake(path: str = SPRITE_PACK_PATH, root: str = ASSET_ROOT) -> SpritePack:
+    """Load the sprite pack, rebuilding it first if the source sprites changed"""
+    if not is_fresh(path, root=root):
+        bake(path, root=root)
+    return load(path, root)
+
+
+def _resolve(path: str, root: str) -> str:
+    return path if os.path.isabs(path) else os.path.join(root, path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Bake every sprite into the sprite pack")
+    parser.add_argument("--output", default=SPRITE_PACK_PATH, help="pack file to write")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the pack is up to date")
+    args = parser.parse_args(argv)
+
+    if not args.force and is_fresh(args.output):
+        print(f"{args.output} is up to date")
+        return 0
+    start = time.perf_counter()
+    size = bake(args.output)
+    pack = load(args.output)
+    width, height = pack.surface.get_size()
+    pack.close()
+    print(
+        f"Baked {len(pack)} frames into a {width}x{height} atlas "
+        f"({size / 1024:.0f} KiB) in {(time.perf_counter() - start) * 1000:.0f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
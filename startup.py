@@ -0,0 +1,57 @@
+import os
+import time
+from typing import List, Optional, Tuple
+
+
+def process_age() -> Optional[float]:
+    """Get how many seconds ago this process started, where the OS tells us (Linux /proc)"""
+    try:
+        with open("/proc/self/stat") as stat_file:
+            # The command name may contain spaces; the fields after it are space separated
+            fields = stat_file.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as uptime_file:
+            uptime = float(uptime_file.read().split()[0])
+        return uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StartupTimer:
+    """Wall-clock milestones from interpreter start to the first frame of the home screen.
+
+    ``mark(phase)`` charges the time since the previous mark to a phase, like
+    the frame profiler. The first phase, "interpreter", is the time the
+    process ran before this module was imported; it is only known where the
+    OS reports process start times and is reported as zero elsewhere.
+    """
+
+    def __init__(self) -> None:
+        now = time.perf_counter()
+        age = process_age()
+        self.origin: float = now - age if age is not None else now
+        self.phases: List[Tuple[str, float]] = [("interpreter", (now - self.origin) * 1000.0)]
+        self._last_mark: float = now
+
+    def mark(self, phase: str) -> None:
+        """Charge the time since the previous mark to a phase"""
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self._last_mark) * 1000.0))
+        self._last_mark = now
+
+    @property
+    def total_ms(self) -> float:
+        return sum(ms for _, ms in self.phases)
+
+    def report(self, budget_ms: Optional[float] = None) -> str:
+        """Format the per-phase breakdown, flagging a total over ``budget_ms``"""
+        lines = [f"{'phase':<14}{'ms':>9}"]
+        lines += [f"{phase:<14}{ms:>9.1f}" for phase, ms in self.phases]
+        lines.append(f"{'total':<14}{self.total_ms:>9.1f}")
+        if budget_ms is not None:
+            verdict = "within" if self.total_ms <= budget_ms else "OVER"
+            lines.append(f"{verdict} the {budget_ms:.0f} ms cold-start budget")
+        return "\n".join(lines)
+
+
+# Started as early as possible: main.py imports this before anything else
+startup: StartupTimer = StartupTimer()
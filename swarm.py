@@ -0,0 +1,369 @@
+import numpy as np
+import pygame
+from typing import List, Optional
+
+from animation import EMPTY_CLIP, clips
+from config import ENEMY_TARGET_SPREAD, WORLD_HEIGHT, WORLD_WIDTH
+from enemy import Enemy
+from pathfinding import FlowField
+from spatial_hash import SpatialHash
+
+# Attack directions stored in the direction array
+ATTACK_RIGHT: int = 0
+ATTACK_LEFT: int = 1
+
+
+class EnemySwarm:
+    """Struct-of-arrays enemy population advanced in one vectorized step per frame.
+
+    Enemies added to the swarm become thin views: their per-frame state
+    (position, offsets, timers, walking and attack state) lives in NumPy
+    arrays here, and ``sync_views`` writes back only what drawing and
+    collision need. Animations are a clip id plus a cursor per enemy, timed
+    against the shared clip library's duration table. ``step`` reproduces
+    ``Enemy.move`` exactly, apart from drawing the random offsets from the
+    swarm's own generator. With a flow field, enemies far from the target
+    follow it around obstacles; one lookup per enemy, whatever the count.
+    """
+
+    def __init__(
+        self,
+        target: pygame.sprite.Sprite,
+        capacity: int = 64,
+        seed: Optional[int] = None,
+        flow_field: Optional[FlowField] = None,
+    ) -> None:
+        self.target: pygame.sprite.Sprite = target
+        # Routes enemies around obstacles when set; kept pointed at the target by its owner
+        self.flow_field: Optional[FlowField] = flow_field
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.views: List[Enemy] = []
+        self.count: int = 0
+        self._allocate(max(1, capacity))
+
+        # Spatial index over the enemies, rebuilt after every step
+        self.grid: SpatialHash = SpatialHash()
+        self._grid_dirty: bool = True
+
+    def _allocate(self, capacity: int) -> None:
+        """Create (or grow) every state array to the given capacity"""
+        old_count = self.count
+        fields = {
+            "left": np.int64,
+            "top": np.int64,
+            "previous_left": np.int64,
+            "previous_top": np.int64,
+            "width": np.int64,
+            "height": np.int64,
+            "offset_x": np.int64,
+            "offset_y": np.int64,
+            "reset_offset": np.int64,
+            "speed": np.int64,
+            "attack_range_sq": np.int64,
+            "is_attacking": np.bool_,
+            "attack_direction": np.int64,
+            "attack_frame_counter": np.int64,
+            "attack_animation_index": np.int64,
+            "walk_clip": np.int64,
+            "walking_state": np.int64,
+            "walking_frame_counter": np.int64,
+            "image_state": np.int64,
+            "is_moving": np.bool_,
+        }
+        for name, dtype in fields.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if old_count:
+                array[:old_count] = getattr(self, name)[:old_count]
+            setattr(self, name, array)
+        # Swing clip ids per attack direction (right, left)
+        swing_clip = np.full((capacity, 2), EMPTY_CLIP, dtype=np.int64)
+        if old_count:
+            swing_clip[:old_count] = self.swing_clip[:old_count]
+        self.swing_clip: np.ndarray = swing_clip
+        self.capacity: int = capacity
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, enemy: Enemy) -> int:
+        """Move an enemy's state into the swarm and turn it into a view"""
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+
+        i = self.count
+        self.left[i] = self.previous_left[i] = enemy.rect.left
+        self.top[i] = self.previous_top[i] = enemy.rect.top
+        self.width[i] = enemy.rect.width
+        self.height[i] = enemy.rect.height
+        self.offset_x[i] = enemy.offset_x
+        self.offset_y[i] = enemy.offset_y
+        self.reset_offset[i] = enemy.reset_offset
+        # Rect.move_ip truncates floats, so the per-step distance is integral
+        self.speed[i] = int(enemy.target_speed)
+        self.attack_range_sq[i] = enemy.attack_range ** 2
+        self.is_attacking[i] = enemy.is_attacking
+        self.attack_direction[i] = ATTACK_LEFT if enemy.get_attack_direction() == "left" else ATTACK_RIGHT
+        self.attack_frame_counter[i] = enemy.attack_frame_counter
+        self.attack_animation_index[i] = enemy.attack_animation_index
+        self.walk_clip[i] = enemy.walk_clip
+        self.walking_state[i] = enemy.walking_state
+        self.walking_frame_counter[i] = enemy.walking_frame_counter
+        self.image_state[i] = enemy.walking_state
+        self.is_moving[i] = enemy.is_moving
+        self.swing_clip[i, ATTACK_RIGHT] = enemy.swing_clips.get("right", enemy.attack_clip)
+        self.swing_clip[i, ATTACK_LEFT] = enemy.swing_clips.get("left", enemy.attack_clip)
+
+        enemy.swarm = self
+        enemy.swarm_index = i
+        self.views.append(enemy)
+        self.count += 1
+        self._grid_dirty = True
+        return i
+
+    def remove(self, enemy: Enemy) -> None:
+        """Remove an enemy from the swarm, writing its final state back to the object"""
+        self.sync_state(enemy)
+        i = enemy.swarm_index
+        last = self.count - 1
+
+        if i != last:
+            # Swap the last enemy into the freed slot to keep the arrays dense
+            for name in self._array_names():
+                array = getattr(self, name)
+                array[i] = array[last]
+            moved = self.views[last]
+            self.views[i] = moved
+            moved.swarm_index = i
+
+        self.views.pop()
+        self.count -= 1
+        self._grid_dirty = True
+        enemy.swarm = None
+        enemy.swarm_index = -1
+
+    def step(self) -> None:
+        """Advance every enemy by one frame (vectorized ``Enemy.move``)"""
+        n = self.count
+        if n == 0 or not self.target:
+            return
+        if self._grid_dirty:
+            self.rebuild_grid()
+
+        left = self.left[:n]
+        top = self.top[:n]
+        width = self.width[:n]
+        height = self.height[:n]
+        is_attacking = self.is_attacking[:n]
+        attack_direction = self.attack_direction[:n]
+        attack_frame_counter = self.attack_frame_counter[:n]
+        attack_animation_index = self.attack_animation_index[:n]
+        walking_state = self.walking_state[:n]
+        walking_frame_counter = self.walking_frame_counter[:n]
+        image_state = self.image_state[:n]
+        is_moving = self.is_moving[:n]
+        reset_offset = self.reset_offset[:n]
+
+        # Remember where every enemy started this tick for render interpolation
+        self.previous_left[:n] = left
+        self.previous_top[:n] = top
+
+        target_x, target_y = self.target.rect.center
+        center_x = left + width // 2
+        center_y = top + height // 2
+        durations = clips.durations_table
+        lengths = clips.lengths
+        swing_clip = self.swing_clip[:n]
+
+        # Start attacks for enemies that are within range of the target
+        in_range = np.zeros(n, dtype=np.bool_)
+        in_range[self.in_attack_range()] = True
+        attack_length = lengths[np.where(target_x < center_x, swing_clip[:, ATTACK_LEFT], swing_clip[:, ATTACK_RIGHT])]
+        starting = in_range & ~is_attacking & (attack_length > 0)
+        if starting.any():
+            attack_direction[starting] = np.where(target_x < center_x[starting], ATTACK_LEFT, ATTACK_RIGHT)
+            is_attacking[starting] = True
+            attack_animation_index[starting] = 0
+            attack_frame_counter[starting] = 0
+
+        # Update attack animations
+        attack_clip = swing_clip[np.arange(n), attack_direction]
+        attack_frame_counter[is_attacking] += 1
+        advancing = is_attacking & (attack_frame_counter >= durations[attack_clip, attack_animation_index])
+        attack_frame_counter[advancing] = 0
+        attack_animation_index[advancing] += 1
+        finished = advancing & (attack_animation_index >= lengths[attack_clip])
+        attack_animation_index[finished] = 0
+        is_attacking[finished] = False
+        image_state[finished] = np.where(is_moving[finished], walking_state[finished], 0)
+
+        # Refresh random offsets whose timers ran out
+        refresh = reset_offset == 0
+        refresh_count = int(refresh.sum())
+        if refresh_count:
+            self.offset_x[:n][refresh] = self.rng.integers(-ENEMY_TARGET_SPREAD, ENEMY_TARGET_SPREAD, refresh_count)
+            self.offset_y[:n][refresh] = self.rng.integers(-ENEMY_TARGET_SPREAD, ENEMY_TARGET_SPREAD, refresh_count)
+            reset_offset[refresh] = self.rng.integers(120, 150, refresh_count)
+        reset_offset[~refresh] -= 1
+
+        # Sign-based steering towards the target plus offset, or along the flow field when far away
+        speed = self.speed[:n]
+        move_x = np.sign(target_x + self.offset_x[:n] - center_x)
+        move_y = np.sign(target_y + self.offset_y[:n] - center_y)
+        if self.flow_field is not None:
+            flow_x, flow_y = self.flow_field.sample_many(center_x, center_y)
+            routed = (flow_x != 0) | (flow_y != 0)
+            move_x = np.where(routed, flow_x, move_x)
+            move_y = np.where(routed, flow_y, move_y)
+        move_x *= speed
+        move_y *= speed
+        left += move_x
+        top += move_y
+
+        # Walking animation
+        moved = (move_x != 0) | (move_y != 0)
+        walk_clip = self.walk_clip[:n]
+        walking_frame_counter[moved] += 1
+        toggling = moved & (walking_frame_counter >= durations[walk_clip, walking_state])
+        walking_frame_counter[toggling] = 0
+        walking_state[toggling] = (walking_state[toggling] + 1) % np.maximum(lengths[walk_clip[toggling]], 1)
+        shown = toggling & ~is_attacking
+        image_state[shown] = walking_state[shown]
+
+        stopped = ~moved
+        walking_state[stopped] = 0
+        walking_frame_counter[stopped] = 0
+        image_state[stopped & ~is_attacking] = 0
+        is_moving[:] = moved
+
+        # Keep enemies within the world
+        np.clip(left, 0, np.maximum(WORLD_WIDTH - width, 0), out=left)
+        np.clip(top, 0, np.maximum(WORLD_HEIGHT - height, 0), out=top)
+
+        self.rebuild_grid()
+
+    def rebuild_grid(self) -> None:
+        """Re-index the current enemy positions in the spatial hash"""
+        n = self.count
+        self.grid.rebuild(self.left[:n], self.top[:n], self.width[:n], self.height[:n])
+        self._grid_dirty = False
+
+    def in_attack_range(self) -> np.ndarray:
+        """Get the indices of enemies whose target is within their attack range"""
+        if self.count == 0 or not self.target:
+            return np.zeros(0, dtype=np.int64)
+        target_x, target_y = self.target.rect.center
+        max_range = float(np.sqrt(self.attack_range_sq[:self.count].max()))
+        candidates = self.grid.query_radius(target_x, target_y, max_range)
+        center_x = self.left[candidates] + self.width[candidates] // 2
+        center_y = self.top[candidates] + self.height[candidates] // 2
+        distance_sq = (center_x - target_x) ** 2 + (center_y - target_y) ** 2
+        return candidates[distance_sq <= self.attack_range_sq[candidates]]
+
+    def first_colliding(self, left: np.ndarray, top: np.ndarray, right: np.ndarray, bottom: np.ndarray) -> np.ndarray:
+        """Batch query: the swarm index of the first enemy overlapping each box, or -1"""
+        if self._grid_dirty:
+            self.rebuild_grid()
+        return self.grid.first_overlaps(left, top, right, bottom)
+
+    def in_view(self, rect: pygame.Rect) -> np.ndarray:
+        """Get the swarm indices of enemies overlapping a region of the world, in swarm order"""
+        if self._grid_dirty:
+            self.rebuild_grid()
+        return self.grid.query_rect(rect)
+
+    def colliding(self, rect: pygame.Rect) -> List[Enemy]:
+        """Get the enemies whose rect overlaps the given rect, in swarm order"""
+        if self._grid_dirty:
+            self.rebuild_grid()
+        return [self.views[i] for i in self.grid.query_rect(rect).tolist()]
+
+    def sync_views(self, alpha: float = 1.0, indices: Optional[np.ndarray] = None) -> None:
+        """Write positions and images back to the enemy objects for drawing
+
+        Positions are interpolated between the last two ticks by ``alpha``, so
+        view rects hold where the enemy is drawn; collision queries go through
+        the swarm's arrays instead. Pass ``indices`` to update only the
+        enemies that will actually be drawn.
+        """
+        if indices is None:
+            indices = np.arange(self.count)
+        lefts = self._interpolate(self.previous_left[indices], self.left[indices], alpha)
+        tops = self._interpolate(self.previous_top[indices], self.top[indices], alpha)
+        # Plain lists index much faster than NumPy scalars in a Python loop
+        lefts = lefts.tolist()
+        tops = tops.tolist()
+        directions = self.attack_direction[indices].tolist()
+        image_states = self.image_state[indices].tolist()
+        attack_indices = self.attack_animation_index[indices].tolist()
+        views = self.views
+        enemies = [views[i] for i in indices.tolist()]
+
+        for enemy, x, y, direction, image_state, attack_index in zip(
+            enemies, lefts, tops, directions, image_states, attack_indices
+        ):
+            enemy.rect.topleft = (x, y)
+            direction_name = "left" if direction == ATTACK_LEFT else "right"
+            if direction_name != enemy.attack_direction:
+                enemy.set_attack_direction(direction_name)
+            if enemy.walking_images:
+                enemy.image = enemy.walking_images[image_state]
+            if enemy.weapon_imgs:
+                enemy.current_weapon_img = enemy.weapon_imgs[attack_index]
+
+    def set_walk_clip(self, index: int, clip_id: int) -> None:
+        """Switch the walk clip of one enemy, keeping its cursor when it still fits"""
+        self.walk_clip[index] = clip_id
+        if self.walking_state[index] >= len(clips[clip_id]):
+            self.walking_state[index] = 0
+            self.image_state[index] = 0
+
+    def set_swing_clips(self, index: int, left_clip: int, right_clip: int) -> None:
+        """Switch the swing clips of one enemy"""
+        self.swing_clip[index, ATTACK_LEFT] = left_clip
+        self.swing_clip[index, ATTACK_RIGHT] = right_clip
+
+    def reset_walking_animation(self, index: int) -> None:
+        """Reset the walking animation of one enemy"""
+        self.walking_state[index] = 0
+        self.walking_frame_counter[index] = 0
+        if not self.is_attacking[index]:
+            self.image_state[index] = 0
+
+    def sync_state(self, enemy: Enemy) -> None:
+        """Write every swarm-owned field back to one enemy object (for inspection)"""
+        i = enemy.swarm_index
+        self._sync_view(i)
+        enemy.offset_x = int(self.offset_x[i])
+        enemy.offset_y = int(self.offset_y[i])
+        enemy.reset_offset = int(self.reset_offset[i])
+        enemy.is_attacking = bool(self.is_attacking[i])
+        enemy.is_moving = bool(self.is_moving[i])
+        enemy.walking_state = int(self.walking_state[i])
+        enemy.walking_frame_counter = int(self.walking_frame_counter[i])
+        enemy.attack_frame_counter = int(self.attack_frame_counter[i])
+        enemy.attack_animation_index = int(self.attack_animation_index[i])
+
+    def _sync_view(self, i: int) -> None:
+        """Write only what drawing and collision read: position and current images"""
+        enemy = self.views[i]
+        enemy.rect.topleft = (int(self.left[i]), int(self.top[i]))
+
+        direction = "left" if self.attack_direction[i] == ATTACK_LEFT else "right"
+        if direction != enemy.attack_direction:
+            enemy.set_attack_direction(direction)
+        if enemy.walking_images:
+            enemy.image = enemy.walking_images[self.image_state[i]]
+        if enemy.weapon_imgs:
+            enemy.current_weapon_img = enemy.weapon_imgs[self.attack_animation_index[i]]
+
+    @staticmethod
+    def _interpolate(previous: np.ndarray, current: np.ndarray, alpha: float) -> np.ndarray:
+        if alpha >= 1.0:
+            return current
+        return np.rint(previous + (current - previous) * alpha).astype(np.int64)
+
+    def _array_names(self) -> List[str]:
+        return [
+            name for name, value in vars(self).items()
+            if isinstance(value, np.ndarray)
+        ]
@@ -0,0 +1,80 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from config import TEXT_CACHE_SIZE
+
+Color = Tuple[int, int, int]
+TextKey = Tuple[Optional[str], int, str, Color, bool]
+
+
+class TextCache:
+    """Shares Font objects and rendered text Surfaces across the whole game.
+
+    Fonts are keyed by (name, size) and kept forever; rendered text is keyed
+    by (font name, size, text, color, antialias) and the least recently used
+    entries are evicted once ``max_entries`` is exceeded. Returned Surfaces
+    are shared and must not be drawn onto.
+    """
+
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE) -> None:
+        self.max_entries: int = max_entries
+        self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self._rendered: "OrderedDict[TextKey, pygame.Surface]" = OrderedDict()
+
+        # Cache statistics
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def font(self, size: int, name: Optional[str] = None) -> pygame.font.Font:
+        """Get a shared Font (``name`` None is pygame's default font)"""
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
+
+    def render(
+        self,
+        text: str,
+        size: int,
+        color: Color,
+        antialias: bool = True,
+        name: Optional[str] = None,
+    ) -> pygame.Surface:
+        """Get the rendered Surface for a piece of text, rendering it only on first use"""
+        key = (name, size, text, tuple(color), antialias)
+        surface = self._rendered.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._rendered.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(size, name).render(text, antialias, color)
+        self._rendered[key] = surface
+        if len(self._rendered) > self.max_entries:
+            self._rendered.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def stats(self) -> dict:
+        """Get hit/miss counters and cache sizes"""
+        return {
+            "fonts": len(self._fonts),
+            "entries": len(self._rendered),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached Font and rendered Surface"""
+        self._fonts.clear()
+        self._rendered.clear()
+
+
+# Shared cache used by the HUD, buttons, menus and overlays
+text_cache: TextCache = TextCache()
@@ -0,0 +1,210 @@
+import os
+import numpy as np
+import pygame
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+from assets import ASSET_ROOT
+from config import CHUNK_BUILDS_PER_FRAME, CHUNK_CACHE_SIZE, CHUNK_TILES, GAME_BG
+
+Color = Tuple[int, int, int]
+ChunkKey = Tuple[int, int]
+
+
+class TileMap:
+    """Grid of tiles loaded from a ``.map`` text file.
+
+    The format is line based; blank lines and lines starting with ``#`` are
+    ignored until the map itself begins::
+
+        size 64                  # pixels per tile
+        tile . 45 45 50          # tile code, color
+        tile # 26 26 32 solid    # solid tiles block enemy paths
+        rows
+        ....####....
+
+    Every line after ``rows`` is one row of tile codes.
+    """
+
+    def __init__(self, tile_size: int, colors: List[Color], solid: List[bool], tiles: np.ndarray) -> None:
+        self.tile_size: int = tile_size
+        self.colors: List[Color] = colors
+        self.solid: np.ndarray = np.array(solid, dtype=np.bool_)  # Per tile type
+        self.tiles: np.ndarray = tiles  # (rows, columns) tile type indices
+        self.rows, self.columns = tiles.shape
+        self.width: int = self.columns * tile_size
+        self.height: int = self.rows * tile_size
+
+    @classmethod
+    def load(cls, path: str) -> "TileMap":
+        """Parse a map file (relative paths are resolved from the repo root)"""
+        if not os.path.isabs(path):
+            path = os.path.join(ASSET_ROOT, path)
+
+        tile_size = 0
+        codes: Dict[str, int] = {}
+        colors: List[Color] = []
+        solid: List[bool] = []
+        rows: List[str] = []
+        in_rows = False
+        with open(path) as map_file:
+            for number, line in enumerate(map_file, 1):
+                line = line.rstrip("\n")
+                if in_rows:
+                    if line:
+                        rows.append(line)
+                    continue
+                fields = line.split()
+                if not fields or fields[0].startswith("#"):
+                    continue
+
+                keyword = fields[0]
+                if keyword == "size" and len(fields) == 2:
+                    tile_size = int(fields[1])
+                elif keyword == "tile" and len(fields) in (5, 6) and len(fields[1]) == 1:
+                    codes[fields[1]] = len(colors)
+                    colors.append((int(fields[2]), int(fields[3]), int(fields[4])))
+                    solid.append(fields[5:] == ["solid"])
+                elif keyword == "rows":
+                    in_rows = True
+                else:
+                    raise ValueError(f"{path}:{number}: cannot parse {line!r}")
+
+        if tile_size <= 0 or not rows:
+            raise ValueError(f"{path}: a map needs a 'size' line and at least one row")
+        if any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError(f"{path}: every row must have the same number of tiles")
+        try:
+            tiles = np.array([[codes[code] for code in row] for row in rows], dtype=np.uint8)
+        except KeyError as error:
+            raise ValueError(f"{path}: unknown tile code {error.args[0]!r}") from None
+        return cls(tile_size, colors, solid, tiles)
+
+
+class ChunkedTileRenderer:
+    """Draws a TileMap from pre-rendered chunk Surfaces instead of per-tile blits.
+
+    The map is split into square chunks of ``chunk_tiles`` tiles. A chunk is
+    rendered into its own Surface the first time it is needed and kept in an
+    LRU cache of at most ``max_chunks`` Surfaces, so painting a screen region
+    is a handful of clipped blits whatever the tile count. ``prefetch`` builds
+    the chunks around the view a few at a time, so walking into new parts of
+    the map does not stall a frame.
+    """
+
+    def __init__(
+        self,
+        tilemap: TileMap,
+        chunk_tiles: int = CHUNK_TILES,
+        max_chunks: int = CHUNK_CACHE_SIZE,
+        builds_per_frame: int = CHUNK_BUILDS_PER_FRAME,
+        background: Color = GAME_BG,
+    ) -> None:
+        self.tilemap: TileMap = tilemap
+        self.chunk_tiles: int = chunk_tiles
+        self.chunk_size: int = chunk_tiles * tilemap.tile_size
+        self.max_chunks: int = max_chunks
+        self.builds_per_frame: int = builds_per_frame
+        self.background: Color = background
+        self.map_rect: pygame.Rect = pygame.Rect(0, 0, tilemap.width, tilemap.height)
+        self.chunk_columns: int = -(-tilemap.columns // chunk_tiles)
+        self.chunk_rows: int = -(-tilemap.rows // chunk_tiles)
+        self._chunks: "OrderedDict[ChunkKey, pygame.Surface]" = OrderedDict()
+
+        # Cache statistics
+        self.hits: int = 0
+        self.builds: int = 0
+        self.evictions: int = 0
+
+    def chunk(self, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        """Get a chunk's Surface, rendering it on first use"""
+        key = (chunk_x, chunk_y)
+        surface = self._chunks.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._chunks.move_to_end(key)
+            return surface
+
+        surface = self._build(chunk_x, chunk_y)
+        self._chunks[key] = surface
+        if len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def paint(self, surface: pygame.Surface, rect: pygame.Rect, scroll: Tuple[int, int]) -> None:
+        """Draw the map under a screen region, for a view scrolled to ``scroll``"""
+        world_rect = rect.move(scroll)
+        previous_clip = surface.get_clip()
+        surface.set_clip(rect)
+        if not self.map_rect.contains(world_rect):
+            surface.fill(self.background, rect)
+
+        size = self.chunk_size
+        for chunk_x, chunk_y in self._chunks_in(world_rect):
+            surface.blit(self.chunk(chunk_x, chunk_y), (chunk_x * size - scroll[0], chunk_y * size - scroll[1]))
+        surface.set_clip(previous_clip)
+
+    def prefetch(self, view: pygame.Rect) -> int:
+        """Build up to ``builds_per_frame`` missing chunks within one chunk of the view, nearest first"""
+        margin = self.chunk_size
+        missing = [key for key in self._chunks_in(view.inflate(margin * 2, margin * 2)) if key not in self._chunks]
+        if not missing:
+            return 0
+        center_x, center_y = view.center
+        half = self.chunk_size // 2
+        missing.sort(
+            key=lambda key: abs(key[0] * self.chunk_size + half - center_x)
+            + abs(key[1] * self.chunk_size + half - center_y)
+        )
+        for chunk_x, chunk_y in missing[:self.builds_per_frame]:
+            self.chunk(chunk_x, chunk_y)
+        return min(len(missing), self.builds_per_frame)
+
+    def stats(self) -> dict:
+        """Get cache counters and the memory held by cached chunks"""
+        return {
+            "chunks": len(self._chunks),
+            "hits": self.hits,
+            "builds": self.builds,
+            "evictions": self.evictions,
+            "bytes": sum(
+                chunk.get_bytesize() * chunk.get_width() * chunk.get_height() for chunk in self._chunks.values()
+            ),
+        }
+
+    def clear(self) -> None:
+        """Drop every cached chunk"""
+        self._chunks.clear()
+
+    def _chunks_in(self, world_rect: pygame.Rect) -> List[ChunkKey]:
+        """Get the keys of the map chunks overlapping a world region"""
+        size = self.chunk_size
+        first_x = max(world_rect.left // size, 0)
+        first_y = max(world_rect.top // size, 0)
+        last_x = min((world_rect.right - 1) // size, self.chunk_columns - 1)
+        last_y = min((world_rect.bottom - 1) // size, self.chunk_rows - 1)
+        return [
+            (chunk_x, chunk_y)
+            for chunk_y in range(first_y, last_y + 1)
+            for chunk_x in range(first_x, last_x + 1)
+        ]
+
+    def _build(self, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        """Render every tile of one chunk into a new display-format Surface"""
+        self.builds += 1
+        tile_size = self.tilemap.tile_size
+        surface = pygame.Surface((self.chunk_size, self.chunk_size)).convert()
+        surface.fill(self.background)
+
+        first_column = chunk_x * self.chunk_tiles
+        first_row = chunk_y * self.chunk_tiles
+        block = self.tilemap.tiles[first_row:first_row + self.chunk_tiles, first_column:first_column + self.chunk_tiles]
+        colors = self.tilemap.colors
+        tile_rect = pygame.Rect(0, 0, tile_size, tile_size)
+        for row, codes in enumerate(block.tolist()):
+            tile_rect.y = row * tile_size
+            for column, code in enumerate(codes):
+                tile_rect.x = column * tile_size
+                surface.fill(colors[code], tile_rect)
+        return surface
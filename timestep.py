@@ -0,0 +1,41 @@
+from config import MAX_TICKS_PER_FRAME, TICK_RATE
+
+
+class FixedTimestep:
+    """Accumulates real time and converts it into a whole number of fixed simulation ticks.
+
+    The simulation always advances in steps of ``dt`` regardless of how fast
+    frames are rendered; the leftover fraction of a tick is exposed as
+    ``alpha`` so rendering can interpolate between the last two ticks.
+    """
+
+    def __init__(self, tick_rate: int = TICK_RATE, max_ticks_per_frame: int = MAX_TICKS_PER_FRAME) -> None:
+        self.tick_rate: int = tick_rate
+        self.dt: float = 1.0 / tick_rate
+        self.max_ticks_per_frame: int = max_ticks_per_frame
+        self.time_scale: float = 1.0  # Above 1.0 fast-forwards the simulation
+        self.accumulator: float = 0.0
+        self.dropped_time: float = 0.0
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a tick elapsed since the last simulation step (0.0 to 1.0)"""
+        return min(self.accumulator / self.dt, 1.0)
+
+    def advance(self, elapsed: float) -> int:
+        """Add real elapsed seconds and get how many ticks to simulate now"""
+        self.accumulator += elapsed * self.time_scale
+        ticks = int(self.accumulator / self.dt)
+
+        if ticks > self.max_ticks_per_frame:
+            # Too far behind to catch up: drop the excess instead of stalling rendering
+            self.dropped_time += (ticks - self.max_ticks_per_frame) * self.dt
+            ticks = self.max_ticks_per_frame
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= ticks * self.dt
+        return ticks
+
+    def reset(self) -> None:
+        """Forget accumulated time (e.g. after the game was paused)"""
+        self.accumulator = 0.0
@@ -1,6 +1,8 @@
 import pygame
 from typing import Tuple
 
+from text_cache import text_cache
+
 
 class Button:
     def __init__(self, x: int, y: int, width: int, height: int, text: str, color: tuple[int, int, int], hover_color: tuple[int, int, int]) -> None:
@@ -9,22 +11,23 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.current_color = color
-        self.font = pygame.font.Font(None, 36)
+        self.font_size = 36
+        self.dirty = True  # Looks different from when it was last drawn
         
     def draw(self, surface: pygame.Surface) -> None:
         pygame.draw.rect(surface, self.current_color, self.rect)
         pygame.draw.rect(surface, (0, 0, 0), self.rect, 2)  # Black border
         
-        text_surface = self.font.render(self.text, True, (0, 0, 0))  # Black text
+        text_surface = text_cache.render(self.text, self.font_size, (0, 0, 0))  # Black text
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
         
     def handle_event(self, event: pygame.event.Event) -> bool:
         if event.type == pygame.MOUSEMOTION:
-            if self.rect.collidepoint(event.pos):
-                self.current_color = self.hover_color
-            else:
-                self.current_color = self.color
+            color = self.hover_color if self.rect.collidepoint(event.pos) else self.color
+            if color != self.current_color:
+                self.current_color = color
+                self.dirty = True
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 return True
@@ -0,0 +1,260 @@
+import random
+import pygame
+from typing import Dict, Optional, Set, Tuple
+
+from animation import clips
+from assets import assets
+from camera import Camera
+from config import ENEMY_POOL_CAPACITY, MAP_PATH, WORLD_HEIGHT, WORLD_WIDTH
+from controls import InputState
+from pathfinding import FlowField
+from enemy import Enemy, SludgeEnemy
+from player import Player
+from profiler import profiler
+from projectile_pool import ProjectilePool
+from renderer import LAYER_ACTORS, LAYER_PROJECTILES, DirtyRectRenderer
+from rotation_cache import rotations
+from scheduler import TimerWheel, ms_to_ticks
+from spawner import EnemyPool, WaveSpawner
+from swarm import EnemySwarm
+from tilemap import ChunkedTileRenderer, TileMap
+from weapon import EnemySword, WeaponType
+
+# Enemy animation clips as data: sprite names and how many ticks each frame is shown
+ENEMY_CLIPS: Dict[str, Tuple[Tuple[str, ...], Tuple[int, ...]]] = {
+    "sludge_walk": (("sludge_neutral1", "sludge_neutral2"), (15, 15)),
+    "bob_walk": (("bob1", "bob2"), (15, 15)),
+    "sludge_swing_left": (
+        ("sludge_sword_20", "sludge_sword_45", "sludge_sword_70", "sludge_sword_90"),
+        (8, 8, 8, 8),
+    ),
+    "sludge_swing_right": (
+        ("sludge_sword_-25", "sludge_sword_-45", "sludge_sword_-65", "sludge_sword_-90"),
+        (8, 8, 8, 8),
+    ),
+}
+
+class GameWorld:
+    """All gameplay state for one run, advanced one fixed simulation tick at a time.
+
+    ``update`` never reads the wall clock and all delayed actions run on the
+    world's tick scheduler, so the same world can be stepped
+    many times per rendered frame (fast-forward) or without a display.
+    ``draw`` only reads state and can be called any number of times per tick.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        # Every random choice in the simulation derives from this seed, so it replays exactly
+        self.seed: int = seed if seed is not None else random.SystemRandom().getrandbits(63)
+        self.rng: random.Random = random.Random(self.seed)
+
+        self.player: Player = Player("Absolute")
+        self.player.rect.center = (WORLD_WIDTH // 2, WORLD_HEIGHT // 2)
+        self.player.previous_position = self.player.rect.topleft
+
+        # The view follows the player around a world larger than the screen
+        self.camera: Camera = Camera()
+        self.camera.snap(self.player.rect)
+        self.main_display_scroll = self.camera.scroll
+
+        # Map drawn under everything; pass background.paint to the renderer
+        self.tilemap: TileMap = TileMap.load(MAP_PATH)
+        self.background: ChunkedTileRenderer = ChunkedTileRenderer(self.tilemap)
+        # One path field towards the player shared by every enemy, rebuilt when the player changes cell
+        self.flow_field: FlowField = FlowField(self.tilemap)
+        self.flow_field.update(*self.player.rect.center)
+
+        # Shared sprites come from the process-wide registry, so restarts never touch the disk
+        sludge_sword_img: pygame.Surface = assets.get("sludge_sword_0")
+        self.sludge_img: pygame.Surface = assets.get("sludge")
+
+        # Walking and sword animation clips, shared by every enemy
+        for clip_name, (sprite_names, durations) in ENEMY_CLIPS.items():
+            clips.define(clip_name, assets.get_many(sprite_names), durations)
+        self.sludge_walk_clip: int = clips.id_of("sludge_walk")
+        self.bob_walk_clip: int = clips.id_of("bob_walk")
+        swing_left_clip: int = clips.id_of("sludge_swing_left")
+        swing_right_clip: int = clips.id_of("sludge_swing_right")
+
+        self.sludge_sword: EnemySword = EnemySword(
+            "sludge_sword",
+            WeaponType.SWORD,
+            3,
+            sludge_sword_img,
+            list(clips[swing_left_clip].frames),
+            list(clips[swing_right_clip].frames),
+        )
+        self.sludge_swing_clips: Tuple[int, int] = (swing_left_clip, swing_right_clip)
+        # Enemies this close outside the view may still have their sword on screen
+        self.cull_margin: int = max(
+            max(frame.get_size()) for frame in clips[swing_left_clip].frames + clips[swing_right_clip].frames
+        ) // 2
+
+        self.enemies: pygame.sprite.Group = pygame.sprite.Group()
+        self.all_sprites: pygame.sprite.Group = pygame.sprite.Group()
+        self.all_sprites.add(self.player)
+
+        # Enemy movement is advanced for the whole population at once
+        self.enemy_swarm: EnemySwarm = EnemySwarm(
+            self.player, capacity=ENEMY_POOL_CAPACITY, seed=self.seed, flow_field=self.flow_field
+        )
+        # Enemies are built once and recycled between deaths and spawns
+        self.enemy_pool: EnemyPool = EnemyPool(self._create_enemy)
+
+        batarang: pygame.Surface = assets.get("batarang")
+        # Pre-render every batarang angle so spinning projectiles never rotate at runtime
+        rotations.prewarm(batarang)
+        # Batarangs reuse preallocated slots instead of allocating per click
+        self.projectile_pool: ProjectilePool = ProjectilePool(batarang)
+
+        # Simulation clock and delayed actions (invincibility windows, cooldowns, ...)
+        self.tick: int = 0
+        self.scheduler: TimerWheel = TimerWheel()
+
+        # Escalating waves; sludge and bob enemies take turns
+        self.spawner: WaveSpawner = WaveSpawner(self._spawn_wave_enemy, self.scheduler)
+        self.spawner.start_next_wave()
+        self.enemies_defeated: int = 0
+
+        # Invincibility frame system
+        self.invincibility_ticks: int = ms_to_ticks(200)
+        self.last_damage_tick: int = -self.invincibility_ticks
+        self.damaged_enemies: Set[Enemy] = set()  # Track which enemies have recently damaged the player
+
+    def _create_enemy(self) -> SludgeEnemy:
+        """Build a pooled sludge enemy; it joins the game when spawned"""
+        enemy = SludgeEnemy(
+            100,
+            3,
+            self.player,
+            self.sludge_sword,
+            self.sludge_img,
+            list(clips[self.sludge_walk_clip].frames),
+            rng=self.rng,
+        )
+        enemy.flow_field = self.flow_field
+        # Play the clips exactly as defined in ENEMY_CLIPS
+        enemy.set_walk_clip(self.sludge_walk_clip)
+        enemy.set_swing_clips(*self.sludge_swing_clips)
+        return enemy
+
+    def _spawn_wave_enemy(self, number: int) -> SludgeEnemy:
+        return self.spawn_enemy(self.bob_walk_clip if number % 2 else self.sludge_walk_clip)
+
+    def spawn_enemy(self, walk_clip: Optional[int] = None) -> SludgeEnemy:
+        """Bring a sludge enemy in from the pool at a random position"""
+        enemy = self.enemy_pool.acquire()
+        enemy.set_walk_clip(self.sludge_walk_clip if walk_clip is None else walk_clip)
+        enemy.respawn(100)
+        self.enemies.add(enemy)
+        self.all_sprites.add(enemy)
+        self.enemy_swarm.add(enemy)
+        return enemy
+
+    def despawn_enemy(self, enemy: Enemy) -> None:
+        """Take an enemy out of the game and return it to the pool"""
+        self.enemy_swarm.remove(enemy)
+        enemy.kill()
+        self.damaged_enemies.discard(enemy)
+        self.enemy_pool.release(enemy)
+
+    def fire(self, target_x: int, target_y: int) -> None:
+        """Throw a batarang from the player towards a point"""
+        self.projectile_pool.fire(
+            self.player.rect.centerx,
+            self.player.rect.centery,
+            target_x,
+            target_y,
+        )
+
+    def update(self, inputs: Optional[InputState] = None) -> None:
+        """Advance the simulation by exactly one tick, reading the live devices if no input is given"""
+        if inputs is None:
+            inputs = InputState.from_devices()
+        # Input arrives in screen coordinates; the simulation works in world coordinates
+        inputs = inputs.translated(*self.camera.scroll)
+        player = self.player
+
+        for target_x, target_y in inputs.clicks:
+            self.fire(target_x, target_y)
+
+        self.spawner.update(len(self.enemies))
+
+        # The player moves first so the swarm steers towards its new position
+        player.update(inputs)
+        profiler.mark("player_update")
+        self.flow_field.update(*player.rect.center)
+        profiler.mark("pathfinding")
+        self.enemy_swarm.step()
+        profiler.mark("enemy_move")
+        self.projectile_pool.step()
+        profiler.mark("projectile_update")
+
+        # Batarangs damage the first enemy they hit and are used up
+        defeated_enemies = self.projectile_pool.hit_test(self.enemy_swarm, player.weapon.damage)
+        for enemy in defeated_enemies:
+            self.despawn_enemy(enemy)
+        self.enemies_defeated += len(defeated_enemies)
+
+        # Only enemies in the grid cells around the player are tested
+        touching_enemies = self.enemy_swarm.colliding(player.rect)
+        if touching_enemies:
+            # Only process one enemy per collision check
+            enemy = touching_enemies[0]
+            # Check if enough time has passed since last damage and enemy hasn't recently damaged player
+            if (
+                self.tick - self.last_damage_tick >= self.invincibility_ticks
+                and enemy not in self.damaged_enemies
+            ):
+                # Reduce player health by enemy's attack power
+                player.health -= enemy.attack_power
+                # Ensure health doesn't go below 0
+                if player.health < 0:
+                    player.health = 0
+
+                # Update invincibility tracking
+                self.last_damage_tick = self.tick
+                self.damaged_enemies.add(enemy)
+
+                # Remove enemy from damaged set after invincibility period
+                self.scheduler.schedule(self.invincibility_ticks, self.damaged_enemies.discard, enemy)
+
+        profiler.mark("collision")
+
+        self.camera.follow(player.rect)
+        self.tick += 1
+        self.scheduler.advance()
+
+    def is_over(self) -> bool:
+        """Check if the player is dead"""
+        return self.player.health <= 0
+
+    def draw(self, renderer: DirtyRectRenderer, alpha: float = 1.0) -> None:
+        """Draw every visible sprite, interpolated ``alpha`` of the way into the current tick
+
+        Only enemies and projectiles inside the camera's view are touched, so
+        drawing costs the same however large the world is. Sprites are queued
+        on the renderer, ordered by how low they stand on screen so nearer
+        characters overlap further ones, and blitted together at the end.
+        """
+        offset = self.camera.offset(alpha)
+        view = self.camera.view_rect(alpha)
+        # Render the map chunks the player is heading towards before they scroll in
+        self.background.prefetch(view)
+
+        renderer.queue(self.player.sprites(alpha, offset), LAYER_ACTORS, self.player.render_rect(alpha).bottom)
+        profiler.mark("player_draw")
+
+        visible = self.enemy_swarm.in_view(view.inflate(self.cull_margin * 2, self.cull_margin * 2))
+        self.enemy_swarm.sync_views(alpha, visible)
+        views = self.enemy_swarm.views
+        for i in visible.tolist():
+            enemy = views[i]
+            renderer.queue(enemy.sprites(offset), LAYER_ACTORS, enemy.rect.bottom)
+        profiler.mark("enemy_draw")
+
+        renderer.queue(self.projectile_pool.sprites(alpha, view), LAYER_PROJECTILES)
+        profiler.mark("projectile_draw")
+
+        renderer.flush()
+        profiler.mark("sprite_blit")